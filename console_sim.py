@@ -6,12 +6,19 @@ resource generation, stack resolution, and stubbed cryptid branches.
 from __future__ import annotations
 
 import argparse
+from typing import Optional
 
 from tcg.game import GameState, initial_game
 
 
-def run_simulation(turns: int = 3, deck_template: str = "balanced", until_win: bool = False, max_turns: int = 30) -> GameState:
-    game = initial_game(deck_template)
+def run_simulation(
+    turns: int = 3,
+    deck_template: str = "balanced",
+    until_win: bool = False,
+    max_turns: int = 30,
+    seed: Optional[int] = None,
+) -> GameState:
+    game = initial_game(deck_template, seed=seed)
     if until_win:
         log = game.play_until_over(max_turns=max_turns)
         print("\n".join(log))
@@ -51,5 +58,17 @@ if __name__ == "__main__":
         default=30,
         help="Maximum turns to simulate when playing until win",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for deck shuffles to make a run reproducible",
+    )
     args = parser.parse_args()
-    run_simulation(turns=args.turns, deck_template=args.deck, until_win=args.until_win, max_turns=args.max_turns)
+    run_simulation(
+        turns=args.turns,
+        deck_template=args.deck,
+        until_win=args.until_win,
+        max_turns=args.max_turns,
+        seed=args.seed,
+    )
@@ -4,8 +4,9 @@ from __future__ import annotations
 import copy
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import cached_property
 import re
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .resources import ResourcePool
 from .stack import StackItem
@@ -78,6 +79,13 @@ class Card:
 
         return self.image_path or f"assets/cards/{slugify(self.name)}.png"
 
+    @cached_property
+    def display_blurb(self) -> str:
+        """Rules text clipped to the length shown on a card face."""
+
+        text = self.text or ""
+        return text if len(text) <= 70 else text[:70] + "..."
+
 
 @dataclass
 class TerritoryCard(Card):
@@ -106,9 +114,15 @@ class Cryptid(Card):
     moves: List[Move] = field(default_factory=list)
     territory_types: List[str] = field(default_factory=list)
     current_health: int = field(init=False)
+    # (cost_fear, cost_belief, move) sorted cheapest first, ties by highest damage
+    _move_costs: List[Tuple[int, int, Move]] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.current_health = self.stats.health
+        self._move_costs = [
+            (mv.cost_fear, mv.cost_belief, mv)
+            for mv in sorted(self.moves, key=lambda m: (m.cost_fear + m.cost_belief, -m.damage))
+        ]
 
     def spawn_triggers(self) -> List[StackItem]:
         return [
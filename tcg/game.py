@@ -1,28 +1,72 @@
 """Skeleton game state and helpers for the console simulator."""
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
 import random
 
 from .cards import Card, Cryptid, EventCard, GodCard, Move, TerritoryCard, starter_deck
-from .phases import Phase, PhaseLoop
+from .phases import PhaseLoop
 from .resources import ResourcePool
 from .stack import GameStack, StackItem
 from .territory import Territory, belief_territory, fear_territory
 
 
-@dataclass
+# Zero-damage fallback so combat never has to branch on a missing move
+_BASIC_STRIKE = Move(name="basic strike", damage=0, text="Attack with raw power alone.")
+
+
+# Player and card names repeat across turns and games, so the common messages are interned.
+
+@lru_cache(maxsize=4096)
+def _cannot_afford(player_name: str, card_name: str) -> str:
+    return f"{player_name} cannot afford {card_name}."
+
+
+@lru_cache(maxsize=4096)
+def _summons_msg(player_name: str, card_name: str, stats_text: str) -> str:
+    return f"{player_name} summons {card_name} ({stats_text})."
+
+
+@lru_cache(maxsize=4096)
+def _draws_msg(player_name: str, card_name: str) -> str:
+    return f"{player_name} draws {card_name}."
+
+
+@lru_cache(maxsize=256)
+def _ends_turn_msg(player_name: str) -> str:
+    return f"{player_name} ends the turn."
+
+
+@dataclass(slots=True)
 class PlayerState:
     name: str
     resources: ResourcePool = field(default_factory=ResourcePool)
     battlefield: List[Card] = field(default_factory=list)
     territories: List[object] = field(default_factory=list)
-    territory_queue: List[Territory] = field(default_factory=list)
+    territory_queue: Deque[Territory] = field(default_factory=deque)
     deck: List[Card] = field(default_factory=list)
     hand: List[Card] = field(default_factory=list)
     influence: int = 20
+    _affordable: Dict[int, bool] = field(default_factory=dict, init=False, repr=False)
+    _affordable_revision: int = field(default=-1, init=False, repr=False)
+    _live_cryptid_count: int = field(default=0, init=False, repr=False)
+
+    def can_afford(self, card: Card) -> bool:
+        """Return ``card.can_play`` memoized until the resource pool next changes."""
+
+        revision = self.resources.revision
+        if revision != self._affordable_revision:
+            self._affordable.clear()
+            self._affordable_revision = revision
+        key = id(card)
+        affordable = self._affordable.get(key)
+        if affordable is None:
+            affordable = self._affordable[key] = card.can_play(self.resources)
+        return affordable
 
     def play_territory(self, territory: Territory, stack: GameStack) -> str:
         self.territories.append(territory)
@@ -38,18 +82,19 @@ class PlayerState:
 
     def summon(self, cryptid: Cryptid, stack: GameStack) -> str:
         if not cryptid.can_play(self.resources):
-            return f"{self.name} cannot afford {cryptid.name}."
+            return _cannot_afford(self.name, cryptid.name)
         if not cryptid.pay_cost(self.resources):
             return f"{self.name} failed to pay cost for {cryptid.name}."
         cryptid.reset_health()
         self.battlefield.append(cryptid)
+        self._live_cryptid_count += 1
         for trigger in cryptid.spawn_triggers():
             stack.push(trigger)
-        return f"{self.name} summons {cryptid.name} ({cryptid.stats.describe()})."
+        return _summons_msg(self.name, cryptid.name, cryptid.stats.describe())
 
     def cast_event(self, event: EventCard, stack: GameStack) -> str:
         if not event.can_play(self.resources):
-            return f"{self.name} cannot afford {event.name}."
+            return _cannot_afford(self.name, event.name)
         if not event.pay_cost(self.resources):
             return f"{self.name} failed to pay cost for {event.name}."
         stack.push(event.stack_item(self.name))
@@ -57,42 +102,49 @@ class PlayerState:
 
     def play_god(self, god: GodCard, stack: GameStack) -> str:
         if not god.can_play(self.resources):
-            return f"{self.name} cannot afford {god.name}."
+            return _cannot_afford(self.name, god.name)
         if not god.pay_cost(self.resources):
             return f"{self.name} failed to pay cost for {god.name}."
         self.battlefield.append(god)
         stack.push(StackItem(description=f"{self.name} establishes {god.name}"))
         return f"{self.name} invokes {god.name}: {god.prayer_text or god.text}."
 
-    def draw(self, count: int = 1) -> List[str]:
-        log: List[str] = []
+    def draw(self, count: int = 1, log: Optional[List[str]] = None) -> List[str]:
+        """Draw ``count`` cards, appending messages to ``log`` (a new list if omitted)."""
+
+        if log is None:
+            log = []
         for _ in range(count):
             if not self.deck:
                 log.append(f"{self.name} would draw but the deck is empty.")
                 break
             card = self.deck.pop(0)
             self.hand.append(card)
-            log.append(f"{self.name} draws {card.name}.")
+            log.append(_draws_msg(self.name, card.name))
         return log
 
     def play_first_affordable(self, stack: GameStack) -> str:
-        for card in list(self.hand):
+        # Hand order is shown in the GUI, so drop by index rather than swap-pop
+        hand = self.hand
+        for i, card in enumerate(hand):
             if isinstance(card, TerritoryCard):
-                self.hand.remove(card)
+                del hand[i]
                 return self.settle_territory_card(card, stack)
-            if isinstance(card, Cryptid) and card.can_play(self.resources):
-                self.hand.remove(card)
+            if isinstance(card, Cryptid) and self.can_afford(card):
+                del hand[i]
                 return self.summon(card, stack)
-            if isinstance(card, EventCard) and card.can_play(self.resources):
-                self.hand.remove(card)
+            if isinstance(card, EventCard) and self.can_afford(card):
+                del hand[i]
                 return self.cast_event(card, stack)
-            if isinstance(card, GodCard) and card.can_play(self.resources):
-                self.hand.remove(card)
+            if isinstance(card, GodCard) and self.can_afford(card):
+                del hand[i]
                 return self.play_god(card, stack)
         return f"{self.name} holds position, hand: {', '.join(c.name for c in self.hand) or 'empty'}; resources: {self.resources.describe()}."
 
-    def pray_with_gods(self, opponent: "PlayerState", stack: GameStack) -> List[str]:
-        prayers: List[str] = []
+    def pray_with_gods(
+        self, opponent: "PlayerState", stack: GameStack, log: Optional[List[str]] = None
+    ) -> List[str]:
+        prayers: List[str] = [] if log is None else log
         for card in self.battlefield:
             if isinstance(card, GodCard):
                 prayers.append(f"{self.name} prays to {card.name}. {card.pray(self, opponent)}")
@@ -100,7 +152,7 @@ class PlayerState:
         return prayers
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     players: Tuple[PlayerState, PlayerState]
     stack: GameStack = field(default_factory=GameStack)
@@ -109,31 +161,35 @@ class GameState:
     winner: Optional[PlayerState] = None
     game_over_reason: Optional[str] = None
 
-    def step(self) -> List[str]:
-        """Advance through one turn worth of phases with lightweight scripting."""
+    def step(self, log: Optional[List[str]] = None) -> List[str]:
+        """Advance through one turn worth of phases with lightweight scripting.
+
+        Messages are appended to ``log`` when given so long runs share one list.
+        """
 
-        log: List[str] = [f"-- Turn {self.turn} --"]
-        active, opposing = self.players[self.turn % 2], self.players[(self.turn + 1) % 2]
+        if log is None:
+            log = []
+        append = log.append
+        turn = self.turn
+        append(f"-- Turn {turn} --")
+        players = self.players
+        active, opposing = players[turn % 2], players[(turn + 1) % 2]
+        dispatch = self._PHASE_DISPATCH
         for phase in self.phases:
-            if phase == Phase.START:
-                log.extend(active.draw())
-            elif phase == Phase.MAIN:
-                log.extend(self._run_main_phase(active, opposing))
-            elif phase == Phase.COMBAT:
-                log.extend(self._run_combat_phase(active, opposing))
-            elif phase == Phase.END:
-                log.append(f"{active.name} ends the turn.")
-        log.extend(self.stack.resolve_all())
+            dispatch[phase](self, active, opposing, log)
+        self.stack.resolve_all(log)
         self._check_winner(log)
-        self.turn += 1
+        self.turn = turn + 1
         return log
 
     def play_until_over(self, max_turns: int = 30) -> List[str]:
         """Drive turns until a winner is found or a turn limit is reached."""
 
         full_log: List[str] = []
+        # winner/turn change inside step, so only the bound method is hoisted
+        step = self.step
         while not self.winner and self.turn <= max_turns:
-            full_log.extend(self.step())
+            step(full_log)
         if not self.winner and self.turn > max_turns:
             self.game_over_reason = self.game_over_reason or f"Reached turn limit {max_turns}."
         if self.winner:
@@ -142,42 +198,47 @@ class GameState:
             full_log.append(self.game_over_reason)
         return full_log
 
-    def _run_main_phase(self, player: PlayerState, opponent: PlayerState) -> List[str]:
-        log: List[str] = []
+    def _run_start_phase(self, player: PlayerState, opponent: PlayerState, log: List[str]) -> None:
+        player.draw(log=log)
+
+    def _run_main_phase(self, player: PlayerState, opponent: PlayerState, log: List[str]) -> None:
         # Auto-play first territory if available
         if player.territory_queue:
-            territory = player.territory_queue.pop(0)
+            territory = player.territory_queue.popleft()
             log.append(player.play_territory(territory, self.stack))
         if player.hand:
             log.append(player.play_first_affordable(self.stack))
         else:
             log.append(f"{player.name} has no cards in hand.")
-        log.extend(player.pray_with_gods(opponent, self.stack))
-        return log
+        player.pray_with_gods(opponent, self.stack, log)
 
-    def _run_combat_phase(self, attacker: PlayerState, defender: PlayerState) -> List[str]:
-        log: List[str] = []
+    def _run_combat_phase(self, attacker: PlayerState, defender: PlayerState, log: List[str]) -> None:
         attackers = [c for c in attacker.battlefield if isinstance(c, Cryptid) and c.current_health > 0]
-        blockers = [c for c in defender.battlefield if isinstance(c, Cryptid) and c.current_health > 0]
+        blockers = [
+            (i, c) for i, c in enumerate(defender.battlefield) if isinstance(c, Cryptid) and c.current_health > 0
+        ]
         if not attackers:
-            return [f"{attacker.name} has no cryptids to attack with."]
+            log.append(f"{attacker.name} has no cryptids to attack with.")
+            return
 
         attacker_card = sorted(attackers, key=lambda c: (c.stats.speed, c.stats.power), reverse=True)[0]
         move = self._select_move(attacker_card, attacker.resources)
-        damage = move.damage + attacker_card.stats.power if move else attacker_card.stats.power
+        damage = attacker_card.stats.power + move.damage
 
         if blockers:
-            target = sorted(blockers, key=lambda c: (c.current_health, c.stats.defense))[0]
-            prevented = min(target.stats.defense, damage)
-            dealt = max(1, damage - target.stats.defense)
+            target_index, target = sorted(blockers, key=lambda entry: (entry[1].current_health, entry[1].stats.defense))[0]
+            defense = target.stats.defense
+            dealt = damage - defense
+            dealt = dealt if dealt > 1 else 1
             target.current_health -= dealt
             log.append(
-                f"{attacker.name}'s {attacker_card.name} uses {move.name if move else 'basic strike'} for {damage} damage "
-                f"into {defender.name}'s {target.name} (DEF {target.stats.defense}), dealing {dealt} after prevention."
+                f"{attacker.name}'s {attacker_card.name} uses {move.name} for {damage} damage "
+                f"into {defender.name}'s {target.name} (DEF {defense}), dealing {dealt} after prevention."
             )
             if target.current_health <= 0:
                 log.append(f"{target.name} is defeated and sent to the scrapyard.")
-                defender.battlefield.remove(target)
+                del defender.battlefield[target_index]
+                defender._live_cryptid_count -= 1
         else:
             defender.influence = max(0, defender.influence - damage)
             log.append(
@@ -185,14 +246,17 @@ class GameState:
                 f"{defender.name} now at {defender.influence}."
             )
 
-        return log
+    def _run_end_phase(self, player: PlayerState, opponent: PlayerState, log: List[str]) -> None:
+        log.append(_ends_turn_msg(player.name))
 
-    def _select_move(self, cryptid: Cryptid, pool: ResourcePool) -> Optional[Move]:
-        for mv in cryptid.moves:
-            if pool.fear >= mv.cost_fear and pool.belief >= mv.cost_belief:
-                pool.spend(fear=mv.cost_fear, belief=mv.cost_belief)
+    def _select_move(self, cryptid: Cryptid, pool: ResourcePool) -> Move:
+        """Pay for and return the cheapest affordable move, or the free basic strike."""
+
+        for cost_fear, cost_belief, mv in cryptid._move_costs:
+            if pool.fear >= cost_fear and pool.belief >= cost_belief:
+                pool.spend(fear=cost_fear, belief=cost_belief)
                 return mv
-        return None
+        return _BASIC_STRIKE
 
     def _check_winner(self, log: List[str]) -> None:
         """Set the winner if a player hits zero influence or runs out of resources."""
@@ -208,7 +272,7 @@ class GameState:
         # Deck-out defeat if someone attempts to draw with an empty deck and an empty hand
         if not defeated:
             for player in self.players:
-                if not player.deck and not player.hand and not any(isinstance(c, Cryptid) for c in player.battlefield):
+                if not player.deck and not player.hand and player._live_cryptid_count == 0:
                     defeated = player
                     self.game_over_reason = f"{player.name} is out of cards and creatures."
                     break
@@ -217,8 +281,14 @@ class GameState:
             self.winner = self.players[0] if defeated is self.players[1] else self.players[1]
             log.append(self.game_over_reason)
 
+    # Indexed by Phase value; entries take (self, active, opposing, log)
+    _PHASE_DISPATCH = (_run_start_phase, _run_main_phase, _run_combat_phase, _run_end_phase)
+
+
+def initial_game(deck_template: str = "balanced", seed: Optional[int] = None) -> GameState:
+    """Seed two players with starter decks; ``seed`` makes the shuffle reproducible."""
 
-def initial_game(deck_template: str = "balanced") -> GameState:
+    rng = random.Random(seed)
     cpu = PlayerState(name="CPU")
     human = PlayerState(name="You")
     # Seed players with starter territories
@@ -230,7 +300,17 @@ def initial_game(deck_template: str = "balanced") -> GameState:
     )
     for player in (cpu, human):
         player.deck.extend(starter_deck(deck_template))
-        random.shuffle(player.deck)
+        rng.shuffle(player.deck)
         player.draw(3)
     # CPU is always index 0, human is index 1
     return GameState(players=(cpu, human))
+
+
+def initial_games_batch(
+    count: int, deck_template: str = "balanced", seeds: Optional[Sequence[int]] = None
+) -> List[GameState]:
+    """Build ``count`` independent games for batch simulation, one RNG per game."""
+
+    if seeds is not None and len(seeds) != count:
+        raise ValueError(f"Expected {count} seeds, got {len(seeds)}")
+    return [initial_game(deck_template, seed=seeds[i] if seeds is not None else None) for i in range(count)]
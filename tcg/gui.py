@@ -1,17 +1,244 @@
 """Tkinter GUI for a lightweight hands-on card demo."""
 from __future__ import annotations
 
+import re
 import tkinter as tk
 import tkinter.font as tkfont
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
 
 import ttkbootstrap as tb
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageFilter, ImageFont, ImageTk
+
+from .cards import Card, CardType
+from .game import GameState, PlayerState, initial_game
+
+
+PLAYMAT_PATH = "assets/board/playmat_portal.png"
+ART_SOURCE_MAX = 512
+
+
+@lru_cache(maxsize=1024)
+def _truncate(text: str, limit: int) -> str:
+    """Card text never changes, so each (text, limit) pair is sliced only once."""
+
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+@lru_cache(maxsize=None)
+def _cost_label(cost_fear: int, cost_belief: int) -> str:
+    parts = []
+    if cost_fear:
+        parts.append(f"{cost_fear} Fear")
+    if cost_belief:
+        parts.append(f"{cost_belief} Belief")
+    return ", ".join(parts) if parts else "Free"
+
+
+@lru_cache(maxsize=None)
+def _cost_text(cost_fear: int, cost_belief: int) -> str:
+    parts: list[str] = []
+    if cost_belief:
+        parts.append(f"{cost_belief} Belief")
+    if cost_fear:
+        parts.append(f"{cost_fear} Fear")
+    return "Cost: " + (", ".join(parts) if parts else "Free")
+
+
+@lru_cache(maxsize=64)
+def _card_art_source(path: str) -> Optional[Image.Image]:
+    """Decode card art once, pre-reduced to ``ART_SOURCE_MAX``; every on-screen size resizes from this.
+
+    Callers must treat the returned image as read-only.
+    """
+
+    art_path = Path(path)
+    if not art_path.exists():
+        return None
+    try:
+        with Image.open(art_path) as source:
+            # JPEG art can be decoded at a reduced scale; other formats ignore the request
+            source.draft("RGB", (ART_SOURCE_MAX, ART_SOURCE_MAX))
+            # Opaque art stays 3-channel; only sources that carry alpha pay for RGBA
+            has_alpha = source.mode in ("RGBA", "LA", "PA") or "transparency" in source.info
+            image = source.convert("RGBA" if has_alpha else "RGB")
+    except OSError:
+        return None
+    factor = max(image.size) // ART_SOURCE_MAX
+    if factor >= 2:
+        image = image.reduce(factor)
+    return image
+
+
+@lru_cache(maxsize=256)
+def _affordability(cost_fear: int, cost_belief: int, fear: int, belief: int) -> tuple[bool, str]:
+    missing_fear = max(cost_fear - fear, 0)
+    missing_belief = max(cost_belief - belief, 0)
+    if not missing_fear and not missing_belief:
+        return True, "Affordable"
+    missing_parts = []
+    if missing_belief:
+        missing_parts.append(f"{missing_belief} Belief")
+    if missing_fear:
+        missing_parts.append(f"{missing_fear} Fear")
+    return False, f"Need {', '.join(missing_parts)}"
+
+
+@lru_cache(maxsize=None)
+def _pil_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    """Pillow counterpart of the Tk fonts; Tk sizes are points, Pillow wants pixels."""
+
+    pixels = round(size * 4 / 3)
+    names = ("DejaVuSans-Bold.ttf", "arialbd.ttf") if bold else ("DejaVuSans.ttf", "arial.ttf")
+    for name in names:
+        try:
+            return ImageFont.truetype(name, pixels)
+        except OSError:
+            continue
+    # Sized default font needs Pillow >= 10.1 (requirements/ux.txt); the PyPI wheels bundle
+    # FreeType, so it is a scalable font with .size and anchor support like truetype()
+    return ImageFont.load_default(pixels)
+
+
+def _wrap_pil_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont, width: float) -> list[str]:
+    lines: list[str] = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if current and draw.textlength(candidate, font=font) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+def _draw_wrapped_pil(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    x: float,
+    y: float,
+    font: ImageFont.ImageFont,
+    width: float,
+    fill: str,
+) -> float:
+    """Draw ``text`` word-wrapped to ``width`` and return the y below the last line."""
+
+    for paragraph in text.split("\n"):
+        for line in _wrap_pil_text(draw, paragraph, font, width) or [""]:
+            draw.text((x, y), line, font=font, fill=fill)
+            y += font.size + 4
+    return y
+
+
+@lru_cache(maxsize=None)
+def _hex_to_rgb(value: str) -> tuple[int, int, int]:
+    value = value.lstrip("#")
+    return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+
+
+@lru_cache(maxsize=512)
+def _blend_hex(base: str, mix: str, ratio: float) -> str:
+    base_r, base_g, base_b = _hex_to_rgb(base)
+    mix_r, mix_g, mix_b = _hex_to_rgb(mix)
+    r = int(base_r * (1 - ratio) + mix_r * ratio)
+    g = int(base_g * (1 - ratio) + mix_g * ratio)
+    b = int(base_b * (1 - ratio) + mix_b * ratio)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _slot_extent(slots: Iterable[tuple[float, float, float, float]], pad: float) -> tuple[float, float, float, float]:
+    """Bounding box of ``slots`` grown by ``pad`` on every side, in a single pass."""
+
+    x1 = y1 = float("inf")
+    x2 = y2 = float("-inf")
+    for a, b, c, d in slots:
+        if a < x1:
+            x1 = a
+        if b < y1:
+            y1 = b
+        if c > x2:
+            x2 = c
+        if d > y2:
+            y2 = d
+    return x1 - pad, y1 - pad, x2 + pad, y2 + pad
+
+
+@lru_cache(maxsize=16)
+def _glow_colors(base: str, steps: int) -> tuple[str, ...]:
+    """Insets of a drop-zone glow, fading from ``base`` toward white."""
+
+    return tuple(_blend_hex(base, "#ffffff", round((i + 1) / (steps + 1) * 0.6, 3)) for i in range(steps))
+
+
+_TCL_SPECIAL = re.compile(r'[\\\[\]{}$;"\s]')
+_TCL_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+
+def _tcl_word(value: object) -> str:
+    """Backslash-quote ``value`` so it survives ``eval`` as exactly one Tcl word."""
 
-from .cards import Card, Cryptid, EventCard, GodCard, TerritoryCard
-from .game import GameState, initial_game
+    if isinstance(value, (tuple, list)):
+        value = " ".join(_tcl_word(item) for item in value)
+    else:
+        value = str(value)
+    if not value:
+        return "{}"
+    return _TCL_SPECIAL.sub(lambda m: _TCL_ESCAPES.get(m.group(), "\\" + m.group()), value)
+
+
+class _CanvasBatch:
+    """Queue canvas commands and send them to Tcl in one ``eval`` instead of one call each.
+
+    Each queued command returns its position; ``flush`` returns the command results in the
+    same order, so item ids can be looked up by that position afterwards.
+    """
+
+    def __init__(self, canvas: tk.Canvas) -> None:
+        self.canvas = canvas
+        self._commands: list[str] = []
+
+    def _queue(self, *words: object, **options: object) -> int:
+        parts = [self.canvas._w, *map(_tcl_word, words)]
+        for name, value in options.items():
+            parts.append("-" + name)
+            parts.append(_tcl_word(value))
+        self._commands.append("[" + " ".join(parts) + "]")
+        return len(self._commands) - 1
+
+    def create_rectangle(self, *coords: float, **options: object) -> int:
+        return self._queue("create", "rectangle", *coords, **options)
+
+    def create_text(self, *coords: float, **options: object) -> int:
+        return self._queue("create", "text", *coords, **options)
+
+    def create_oval(self, *coords: float, **options: object) -> int:
+        return self._queue("create", "oval", *coords, **options)
+
+    def create_image(self, *coords: float, **options: object) -> int:
+        return self._queue("create", "image", *coords, **options)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._commands)
+
+    def tag_raise(self, tag: str) -> int:
+        return self._queue("raise", tag)
+
+    def move(self, tag: str, dx: float, dy: float) -> int:
+        return self._queue("move", tag, dx, dy)
+
+    def flush(self) -> tuple[str, ...]:
+        if not self._commands:
+            return ()
+        script = "list " + " ".join(self._commands)
+        self._commands = []
+        return self.canvas.tk.splitlist(self.canvas.tk.eval(script))
 
 
 @dataclass
@@ -21,6 +248,7 @@ class DragState:
     last_x: int = 0
     last_y: int = 0
     hovered_target: Optional[int] = None
+    moved: bool = False
 
 
 class GameGUI:
@@ -41,6 +269,63 @@ class GameGUI:
     CARD_TYPE_STRIP = "#312b39"
     FIELD_GLOW = "#3fc3a3"
     FACTION_BANNER = "#3d4b6a"
+    # itemconfigure options for the outline-only playmat rectangle; the fill is a tint image
+    _DROP_STYLE_IDLE = {
+        "outline": SECONDARY_ACCENT,
+        "dash": (3, 2),
+        "width": 1,
+    }
+    _DROP_STYLE_READY = {
+        "outline": ACCENT_COLOR,
+        "dash": (),
+        "width": 3,
+    }
+    _DROP_STYLE_BLOCKED = {
+        "outline": ALERT_COLOR,
+        "dash": (),
+        "width": 3,
+    }
+    # Alpha of the overlay tints; half coverage matches the gray50 stipple they replace
+    OVERLAY_ALPHA = 128
+    LOG_MAX_LINES = 500
+    # Every (family, size, weight) the GUI draws with, created up front in __init__
+    FONT_SPECS = (
+        ("Arial", 8, "normal"),
+        ("Arial", 8, "bold"),
+        ("Arial", 9, "normal"),
+        ("Arial", 9, "bold"),
+        ("Arial", 10, "normal"),
+        ("Arial", 10, "bold"),
+        ("Arial", 11, "normal"),
+        ("Arial", 11, "bold"),
+        ("Arial", 12, "bold"),
+        ("Arial", 18, "bold"),
+        ("Cinzel", 16, "bold"),
+    )
+    DRAG_PREVIEW_SIZE = (170, 220)
+    DRAG_FRAME_MS = 16
+    RESIZE_DEBOUNCE_MS = 120
+    CPU_STEP_MS = 16
+    SLOT_TAG = "drop_slot"
+    HAND_CARD_SIZE = (150, 190)
+    HAND_LIFT = 14
+    HAND_LIFT_SCALE = 1.08
+    DETAIL_CARD_SIZE = (360, 520)
+    CARD_SURFACE_CACHE_SIZE = 64
+    PLAYMAT_CACHE_SIZE = 8
+    GLOW_CACHE_SIZE = 8
+    TINT_CACHE_SIZE = 48
+    THUMBNAIL_MAX_SIZE = 128
+    HAND_SURFACE_CACHE_SIZE = 48
+    FULL_CARD_CACHE_SIZE = 64
+    BOARD_CACHE_SIZE = 4
+    # Card type -> PlayerState method that puts the card into play
+    _PLAY_DISPATCH = {
+        CardType.TERRITORY: PlayerState.settle_territory_card,
+        CardType.CRYPTID: PlayerState.summon,
+        CardType.EVENT: PlayerState.cast_event,
+        CardType.GOD: PlayerState.play_god,
+    }
 
     def __init__(self, deck_template: str = "balanced") -> None:
         self.style = tb.Style(theme="cyborg")
@@ -54,31 +339,89 @@ class GameGUI:
         self.cpu_index: int = 0
         self.human_index: int = 1
         self.active_index: int = self.human_index
+        self._refresh_player_refs()
         self.drag_state: DragState = DragState()
-        self.card_tags: Dict[tuple[int, str], Card] = {}
+        self.card_tags: list[Dict[str, Card]] = [{}, {}]
         self.selected_card: Optional[Card] = None
         self.selected_player_idx: Optional[int] = None
         self.selected_tag: Optional[str] = None
         self.drag_overlay: Optional[tk.Toplevel] = None
-        self.drag_overlay_canvas: Optional[tk.Canvas] = None
+        self.drag_overlay_label: Optional[tk.Label] = None
         self.drag_overlay_bounds: Optional[tuple[int, int, int, int]] = None
         self.drag_overlay_card: Optional[Card] = None
         self.detail_window: Optional[tk.Toplevel] = None
         self._detail_focusable: list[tk.Widget] = []
+        self._detail_overlay: Optional[tk.Toplevel] = None
+        self._detail_canvas: Optional[tk.Canvas] = None
+        self._detail_backdrop: Optional[int] = None
+        self._detail_frame_item: Optional[int] = None
+        self._detail_card_canvas: Optional[tk.Canvas] = None
+        self._detail_card_item: Optional[int] = None
         self.drop_zone_boxes: Dict[int, tuple[int, int, int, int]] = {}
         self.drop_zone_items: Dict[int, tuple[int, int]] = {}
         self.drop_zone_screen_bounds: Dict[int, tuple[int, int, int, int]] = {}
-        self.drop_zone_gradient_items: Dict[int, list[int]] = {}
+        # (player index, x1, y1, x2, y2) of each zone the current drag may land on, in screen space
+        self._drag_zone_cache: list[tuple[int, int, int, int, int]] = []
+        self._hovered_zone_bounds: Optional[tuple[int, int, int, int]] = None
+        self._last_hover_xy: Optional[tuple[int, int]] = None
+        # Set whenever a window moves/resizes or a drop zone is rebuilt; see _refresh_drop_zone_bounds
+        self._screen_bounds_stale = True
+        self._pending_motion: Optional[tuple[Optional[int], Optional[int], int, int]] = None
+        self._motion_scheduled = False
         self.drop_zone_glow_items: Dict[int, list[int]] = {}
         self.drop_zone_tooltips: Dict[int, tuple[int, int]] = {}
         self.drop_zone_slot_items: Dict[int, list[int]] = {}
         self.drop_zone_background_items: Dict[int, int] = {}
         self._playmat_image_cache: Dict[Tuple[str, int, int], tk.PhotoImage] = {}
-        self._image_cache: Dict[Tuple[str, int, int], tk.PhotoImage] = {}
-        self._font_cache: Dict[Tuple[str, int, str], tkfont.Font] = {}
+        self._playmat_source: Optional[Image.Image] = None
+        self._playmat_loaded = False
+        self._pinned_images: Dict[str, tk.PhotoImage] = {}
+        self._card_surface_cache: Dict[Tuple[str, int, int], ImageTk.PhotoImage] = {}
+        self._shadow_image_cache: Dict[tuple[int, int], ImageTk.PhotoImage] = {}
+        self._glow_image_cache: Dict[tuple[str, int, int], ImageTk.PhotoImage] = {}
+        self._tint_cache: Dict[tuple[str, int, int], ImageTk.PhotoImage] = {}
+        self._board_cache: Dict[tuple[int, int], ImageTk.PhotoImage] = {}
+        self._font_cache: Dict[Tuple[str, int, str], tkfont.Font] = {
+            spec: tkfont.Font(family=spec[0], size=spec[1], weight=spec[2]) for spec in self.FONT_SPECS
+        }
         self._hovered_hand_tag: Optional[str] = None
+        # Retained canvas items: slot/tag -> signature of what is currently drawn there
+        self._bf_layout_keys: Dict[int, tuple] = {}
+        self._bf_items: Dict[int, Dict[str, dict]] = {0: {}, 1: {}}
+        self._bf_view: Dict[int, tuple[tuple, Dict[str, tuple]]] = {}
+        self._bf_zone_labels: Dict[int, Dict[str, tuple[int, str]]] = {}
+        self._hand_items: Dict[int, Dict[str, tuple]] = {0: {}, 1: {}}
+        self._hand_frames: Dict[int, Dict[str, int]] = {0: {}, 1: {}}
+        self._hand_lifted: Dict[int, set[str]] = {0: set(), 1: set()}
+        self._hand_faces: Dict[int, Dict[str, int]] = {0: {}, 1: {}}
+        self._hand_surface_cache: Dict[tuple, ImageTk.PhotoImage] = {}
+        self._full_card_cache: Dict[tuple, ImageTk.PhotoImage] = {}
+        self._hand_highlight: Dict[int, Optional[str]] = {}
+        self._dirty_players: set[int] = set()
+        self._render_scheduled = False
+        self._last_render_sig: Dict[int, tuple] = {}
+        self._last_active_text: Optional[str] = None
+        self._label_texts: Dict[tk.Label, str] = {}
+        self._bf_size: Dict[int, tuple[int, int]] = {}
+        self._hand_width: Dict[int, int] = {}
+        # drop-zone idx -> (rect id, active, affordable, label) last applied by _style_drop_zone
+        self._drop_zone_state: Dict[int, tuple] = {}
+        self._drop_pulse_generation: Dict[int, int] = {}
+        self._drop_pulse_rest: Dict[int, str] = {}
+        # drop-zone slot tag -> (rectangle id, fill, hover fill)
+        self._slot_colors: Dict[str, tuple[int, int, int, str, str]] = {}
+        # drop-zone idx -> (tint image id, width, height, colour) under the playmat rectangle
+        self._drop_zone_tints: Dict[int, tuple[int, int, int, str]] = {}
+        self._resize_after: Dict[int, str] = {}
+        self._log_pending: list[str] = []
+        self._log_scheduled = False
+        # Remaining actions of the CPU turn, run one per CPU_STEP_MS tick
+        self._cpu_steps: Deque[Callable[[], None]] = deque()
 
         self._build_layout()
+        self._build_drag_overlay()
+        # Bound on the toplevel, this also sees every child widget's <Configure>
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
         self._render_all()
 
     def _build_layout(self) -> None:
@@ -96,14 +439,14 @@ class GameGUI:
             text="CRYPTID RITES",
             bg=self.PANEL_COLOR,
             fg=self.ACCENT_COLOR,
-            font=("Cinzel", 16, "bold"),
+            font=self._get_font("Cinzel", 16, "bold"),
         ).pack(anchor="w")
         tk.Label(
             banner,
             text="Drag sigils and beasts onto the ritual field. Stack resolves in style.",
             bg=self.PANEL_COLOR,
             fg=self.MUTED_TEXT,
-            font=("Arial", 10),
+            font=self._get_font("Arial", 10),
         ).pack(anchor="w", pady=(2, 0))
 
         control_frame = tk.Frame(self.root, bg=self.BG_COLOR)
@@ -112,7 +455,7 @@ class GameGUI:
         self.active_label = tk.Label(
             control_frame,
             text="Active player: You",
-            font=("Arial", 12, "bold"),
+            font=self._get_font("Arial", 12, "bold"),
             bg=self.BG_COLOR,
             fg=self.TEXT_COLOR,
         )
@@ -133,7 +476,7 @@ class GameGUI:
                 pady=6,
                 highlightbackground=self.ACCENT_COLOR,
                 highlightthickness=2,
-                font=("Arial", 10, "bold"),
+                font=self._get_font("Arial", 10, "bold"),
             )
 
         for label, cmd in [
@@ -204,7 +547,7 @@ class GameGUI:
                 text=player.name,
                 bg=self.SURFACE_COLOR,
                 fg=self.TEXT_COLOR,
-                font=("Arial", 12, "bold"),
+                font=self._get_font("Arial", 12, "bold"),
             ).pack(side=tk.LEFT)
 
             info_frame = tk.Frame(frame, bg=self.PANEL_COLOR)
@@ -214,7 +557,7 @@ class GameGUI:
                 text="Resources",
                 bg=self.PANEL_COLOR,
                 fg=self.MUTED_TEXT,
-                font=("Arial", 10, "bold"),
+                font=self._get_font("Arial", 10, "bold"),
             )
             resource_lbl.pack(side=tk.LEFT, padx=4)
             self.resource_labels.append(resource_lbl)
@@ -224,7 +567,7 @@ class GameGUI:
                 text="Influence: 20",
                 bg=self.PANEL_COLOR,
                 fg=self.TEXT_COLOR,
-                font=("Arial", 10, "bold"),
+                font=self._get_font("Arial", 10, "bold"),
             )
             influence_lbl.pack(side=tk.LEFT, padx=4)
             self.influence_labels.append(influence_lbl)
@@ -237,6 +580,9 @@ class GameGUI:
                 highlightbackground=self.BORDER_COLOR,
             )
             battlefield.pack(side=tk.TOP, fill=tk.X, padx=4, pady=(8, 6))
+            battlefield.bind("<Configure>", lambda e, p=idx: self._on_bf_resize(p, e.width, e.height))
+            battlefield.tag_bind(self.SLOT_TAG, "<Enter>", lambda e: self._on_slot_hover(e, True))
+            battlefield.tag_bind(self.SLOT_TAG, "<Leave>", lambda e: self._on_slot_hover(e, False))
             self.battlefield_canvases.append(battlefield)
             self.battlefield_layouts.append({})
 
@@ -248,6 +594,12 @@ class GameGUI:
                 highlightbackground=self.BORDER_COLOR,
             )
             hand.pack(side=tk.TOP, fill=tk.X, padx=4, pady=(0, 4))
+            hand.bind("<ButtonPress-1>", lambda e, p=idx: self._on_hand_press(e, p))
+            hand.bind("<B1-Motion>", lambda e, p=idx: self._on_hand_drag(e, p))
+            hand.bind("<ButtonRelease-1>", lambda e, p=idx: self._on_hand_release(e, p))
+            hand.bind("<Motion>", lambda e, p=idx: self._on_hand_motion(e, p))
+            hand.bind("<Leave>", lambda e, p=idx: self._on_hand_leave(p))
+            hand.bind("<Configure>", lambda e, p=idx: self._on_hand_resize(p, e.width))
             self.hand_canvases.append(hand)
 
         log_frame = tk.Frame(
@@ -264,7 +616,7 @@ class GameGUI:
             text="Action Log",
             bg=self.PANEL_COLOR,
             fg=self.MUTED_TEXT,
-            font=("Arial", 10, "bold"),
+            font=self._get_font("Arial", 10, "bold"),
         ).pack(anchor="w")
         self.log_widget = tk.Text(
             log_frame,
@@ -285,33 +637,102 @@ class GameGUI:
         self._log(f"{self.game.players[self.active_index].name}'s turn begins.")
         self._update_active_label()
 
+    def _mark_dirty(self, *indices: int) -> None:
+        """Queue players for a redraw; all queued renders run once when the event loop goes idle."""
+
+        self._dirty_players.update(indices)
+        if not self._render_scheduled:
+            self._render_scheduled = True
+            self.root.after_idle(self._flush_renders)
+
+    def _flush_renders(self) -> None:
+        dirty = sorted(self._dirty_players)
+        self._dirty_players.clear()
+        self._render_scheduled = False
+        for idx in dirty:
+            self._render_player(idx)
+        self._update_active_label()
+
+    def _player_signature(self, idx: int) -> tuple:
+        """Everything _render_player draws for ``idx``; equal signatures mean nothing visible changed."""
+
+        player = self.game.players[idx]
+        resources = player.resources
+        return (
+            player.influence,
+            resources.fear,
+            resources.belief,
+            resources.instability,
+            tuple(map(id, player.hand)),
+            tuple((id(card), getattr(card, "current_health", None)) for card in player.battlefield),
+            len(player.territories),
+            len(player.deck),
+            len(getattr(player, "discard_pile", ())),
+            self.selected_tag if self.selected_player_idx == idx else None,
+            self._battlefield_size(idx),
+            self._hand_canvas_width(idx),
+        )
+
     def _render_player(self, idx: int) -> None:
+        signature = self._player_signature(idx)
+        if self._last_render_sig.get(idx) == signature:
+            return
         player = self.game.players[idx]
-        self.resource_labels[idx].configure(text=player.resources.describe())
-        self.influence_labels[idx].configure(text=f"Influence: {player.influence}")
+        self._set_label_text(self.resource_labels[idx], player.resources.describe())
+        self._set_label_text(self.influence_labels[idx], f"Influence: {player.influence}")
         self._render_battlefield(idx)
         self._render_hand(idx)
-        self._update_active_label()
+        self._last_render_sig[idx] = signature
+
+    def _set_label_text(self, label: tk.Label, text: str) -> None:
+        if self._label_texts.get(label) != text:
+            label.configure(text=text)
+            self._label_texts[label] = text
 
     def _render_battlefield(self, idx: int) -> None:
         canvas = self.battlefield_canvases[idx]
-        canvas.delete("all")
         player = self.game.players[idx]
         layout = self._get_battlefield_layout(idx)
-        self._draw_battlefield_zones(canvas, layout, player)
-        self._draw_drop_zone(idx, layout)
-
+        layout_key = (layout["active"], layout["territories"][0], self._battlefield_size(idx))
+        if self._bf_layout_keys.get(idx) != layout_key:
+            # First render or resize: rebuild the static zones and forget every retained card
+            canvas.delete("all")
+            self._bf_items[idx] = {}
+            self._draw_battlefield_zones(canvas, layout, player, idx)
+            self._draw_drop_zone(idx, layout)
+            self._bf_layout_keys[idx] = layout_key
+        else:
+            self._update_zone_counts(canvas, idx, player)
+        state = self._drop_zone_state.get(idx)
+        if state is not None and state[1] and self.drag_state.hovered_target != idx:
+            # The zone items are kept across renders, so a highlight left over from the last
+            # drop has to be cleared here rather than by a redraw
+            self._style_drop_zone(idx)
+
+        # The slot plan only depends on which cards are in play and where, not on their HP
+        view_key = (layout_key, tuple(map(id, player.battlefield)), tuple(map(id, player.territories)))
+        view = self._bf_view.get(idx)
+        if view is None or view[0] != view_key:
+            view = (view_key, self._plan_battlefield_slots(idx, player, layout))
+            self._bf_view[idx] = view
+        wanted = view[1]
+
+        self._sync_battlefield_slots(canvas, idx, wanted)
+
+    def _plan_battlefield_slots(
+        self, idx: int, player: PlayerState, layout: dict[str, object]
+    ) -> Dict[str, tuple]:
         active_card: Optional[Card] = None
         bench_cards: list[Card] = []
         territory_cards: list[object] = []
         prayer_cards: list[Card] = []
 
         for card in player.battlefield:
-            if isinstance(card, TerritoryCard):
+            if card.type is CardType.TERRITORY:
                 territory_cards.append(card)
-            elif isinstance(card, GodCard):
+            elif card.type is CardType.GOD:
                 prayer_cards.append(card)
-            elif isinstance(card, Cryptid):
+            elif card.type is CardType.CRYPTID:
                 if not active_card:
                     active_card = card
                 else:
@@ -322,36 +743,118 @@ class GameGUI:
         for territory in player.territories:
             territory_cards.append(territory)
 
+        # slot tag -> (card, x, y, width, height, is_territory_tile)
+        wanted: Dict[str, tuple] = {}
         if active_card:
             x1, y1, x2, y2 = layout["active"]
-            self._draw_card_at(canvas, active_card, x1, y1, x2 - x1, y2 - y1, f"bf_{idx}_active")
+            wanted[f"bf_{idx}_active"] = (active_card, x1, y1, x2 - x1, y2 - y1, False)
 
-        for slot, card in zip(layout["bench"], bench_cards):
+        for i, (slot, card) in enumerate(zip(layout["bench"], bench_cards)):
             x1, y1, x2, y2 = slot
-            self._draw_card_at(canvas, card, x1, y1, x2 - x1, y2 - y1, f"bf_{idx}_bench")
+            wanted[f"bf_{idx}_bench_{i}"] = (card, x1, y1, x2 - x1, y2 - y1, False)
 
         for i, card in enumerate(prayer_cards):
             x1, y1, x2, y2 = layout["prayer"]
             offset = i * 14
-            self._draw_card_at(
-                canvas,
+            wanted[f"bf_{idx}_prayer_{i}"] = (
                 card,
                 x1 + offset,
                 y1 + offset,
                 x2 - x1 - offset * 2,
                 y2 - y1 - offset * 2,
-                f"bf_{idx}_prayer_{i}",
+                False,
             )
 
-        for slot, territory in zip(layout["territories"], territory_cards):
+        for i, (slot, territory) in enumerate(zip(layout["territories"], territory_cards)):
             x1, y1, x2, y2 = slot
-            self._draw_territory_tile(canvas, territory, x1, y1, x2 - x1, y2 - y1)
+            wanted[f"bf_{idx}_territory_{i}"] = (territory, x1, y1, x2 - x1, y2 - y1, True)
+
+        return wanted
+
+    def _sync_battlefield_slots(self, canvas: tk.Canvas, idx: int, wanted: Dict[str, tuple]) -> None:
+        """Create, update, or delete only the battlefield slots whose contents changed."""
+
+        retained = self._bf_items[idx]
+        for tag in [tag for tag in retained if tag not in wanted]:
+            canvas.delete(tag)
+            del retained[tag]
+
+        batch = _CanvasBatch(canvas)
+        stats_positions: Dict[str, int] = {}
+        for tag, (card, x, y, width, height, is_tile) in wanted.items():
+            key = (id(card), x, y, width, height)
+            health = getattr(card, "current_health", None)
+            entry = retained.get(tag)
+            if entry and entry["key"] == key:
+                if entry["health"] != health and entry["stats"] is not None:
+                    canvas.itemconfigure(entry["stats"], text=self._stats_text(card))
+                    entry["health"] = health
+                continue
+            if entry:
+                canvas.delete(tag)
+            surface = None
+            if is_tile:
+                self._draw_territory_tile(batch, card, x, y, width, height, tag)
+            else:
+                position, surface = self._draw_card_at(batch, card, x, y, width, height, tag)
+                if position is not None:
+                    stats_positions[tag] = position
+            retained[tag] = {"key": key, "health": health, "stats": None, "surface": surface}
+
+        if batch.pending:
+            # New slots land on top of the stack; re-raise every slot so overlaps keep their order
+            for tag in wanted:
+                batch.tag_raise(tag)
+            results = batch.flush()
+            for tag, position in stats_positions.items():
+                retained[tag]["stats"] = int(results[position])
+
+    @staticmethod
+    def _stats_text(card: Card) -> str:
+        stats = card.stats
+        return f"PWR {stats.power}  DEF {stats.defense}  HP {card.current_health}/{stats.health}"
+
+    def _on_bf_resize(self, idx: int, width: int, height: int) -> None:
+        if self._bf_size.get(idx) == (width, height):
+            return
+        self._bf_size[idx] = (width, height)
+        self._schedule_resize_render(idx)
+
+    def _on_hand_resize(self, idx: int, width: int) -> None:
+        if self._hand_width.get(idx) == width:
+            return
+        self._hand_width[idx] = width
+        self._schedule_resize_render(idx)
+
+    def _schedule_resize_render(self, idx: int) -> None:
+        # A window drag fires a burst of <Configure> events; only the last one repaints.
+        pending = self._resize_after.pop(idx, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._resize_after[idx] = self.root.after(self.RESIZE_DEBOUNCE_MS, self._apply_bf_resize, idx)
+
+    def _apply_bf_resize(self, idx: int) -> None:
+        self._resize_after.pop(idx, None)
+        self._mark_dirty(idx)
+
+    def _battlefield_size(self, idx: int) -> tuple[int, int]:
+        """Canvas size as last reported by <Configure>, so renders never force a layout pass."""
+
+        size = self._bf_size.get(idx)
+        if size is None:
+            canvas = self.battlefield_canvases[idx]
+            size = (canvas.winfo_width(), canvas.winfo_height())
+        return size
+
+    def _hand_canvas_width(self, idx: int) -> int:
+        width = self._hand_width.get(idx)
+        if width is None:
+            width = self.hand_canvases[idx].winfo_width()
+        return width
 
     def _get_battlefield_layout(self, idx: int) -> dict[str, object]:
-        canvas = self.battlefield_canvases[idx]
-        canvas.update_idletasks()
-        width = max(canvas.winfo_width(), 820)
-        height = max(canvas.winfo_height(), 320)
+        canvas_w, _canvas_h = self._battlefield_size(idx)
+        width = max(canvas_w, 820)
         padding = 14
         pile_gap = 12
         pile_width, pile_height = 120, 58
@@ -443,22 +946,53 @@ class GameGUI:
         self.battlefield_layouts[idx] = layout
         return layout
 
-    def _draw_battlefield_zones(self, canvas: tk.Canvas, layout: dict[str, object], player: "PlayerState") -> None:
+    def _draw_battlefield_zones(
+        self, canvas: tk.Canvas, layout: dict[str, object], player: PlayerState, idx: int
+    ) -> None:
+        """Show the static board as one image; only the deck/discard counts stay live text items."""
+
+        canvas_w, canvas_h = self._battlefield_size(idx)
+        board = self._board_image(layout, canvas_w, canvas_h)
+        self._pin_image(f"board_{idx}", board)
+        canvas.create_image(0, 0, anchor="nw", image=board)
+
+        font = self._get_font("Arial", 9, "bold")
+        labels: Dict[str, tuple[int, str]] = {}
+        for name, text in (
+            ("deck", f"Deck ({len(player.deck)})"),
+            ("discard", f"Discard ({len(getattr(player, 'discard_pile', []))})"),
+        ):
+            x1, y1, x2, _ = layout[name]
+            item = canvas.create_text((x1 + x2) / 2, y1 - 10, text=text, fill=self.MUTED_TEXT, font=font)
+            labels[name] = (item, text)
+        self._bf_zone_labels[idx] = labels
+
+    def _board_image(self, layout: dict[str, object], canvas_w: int, canvas_h: int) -> ImageTk.PhotoImage:
+        key = (canvas_w, canvas_h)
+        cache = self._board_cache
+        board = cache.pop(key, None)
+        if board is None:
+            board = ImageTk.PhotoImage(self._render_board(layout, canvas_w, canvas_h))
+            self._evict_oldest(cache, self.BOARD_CACHE_SIZE)
+        cache[key] = board
+        return board
+
+    def _render_board(self, layout: dict[str, object], canvas_w: int, canvas_h: int) -> Image.Image:
+        """Paint the battlefield background, empty slot frames and their captions with Pillow."""
+
+        image = Image.new("RGB", (max(canvas_w, 1), max(canvas_h, 1)), self.SURFACE_COLOR)
+        draw = ImageDraw.Draw(image)
+        font = _pil_font(9, True)
+
         def draw_slot(coords: tuple[float, float, float, float], label: str, fill: str, accent: str) -> None:
             x1, y1, x2, y2 = coords
-            canvas.create_rectangle(x1, y1, x2, y2, outline=accent, width=2, fill=fill)
-            canvas.create_text(
-                (x1 + x2) / 2,
-                y1 - 10,
-                text=label,
-                fill=self.MUTED_TEXT,
-                font=("Arial", 9, "bold"),
-            )
+            draw.rectangle((x1, y1, x2, y2), fill=fill, outline=accent, width=2)
+            if label:
+                draw.text(((x1 + x2) / 2, y1 - 10), label, font=font, fill=self.MUTED_TEXT, anchor="mm")
 
-        canvas.create_rectangle(0, 0, canvas.winfo_width(), canvas.winfo_height(), fill=self.SURFACE_COLOR, outline="")
-        draw_slot(layout["deck"], f"Deck ({len(player.deck)})", self.TABLE_COLOR, self.BORDER_COLOR)
-        discard_size = len(getattr(player, "discard_pile", []))
-        draw_slot(layout["discard"], f"Discard ({discard_size})", self.TABLE_COLOR, self.BORDER_COLOR)
+        # Deck and discard captions carry live counts, so the canvas draws those
+        draw_slot(layout["deck"], "", self.TABLE_COLOR, self.BORDER_COLOR)
+        draw_slot(layout["discard"], "", self.TABLE_COLOR, self.BORDER_COLOR)
         draw_slot(layout["prayer"], "Prayer Pile", self.TABLE_COLOR, self.ACCENT_COLOR)
 
         draw_slot(layout["active"], "Active Slot", self.PANEL_COLOR, self.ACCENT_COLOR)
@@ -468,162 +1002,139 @@ class GameGUI:
         for i, territory_slot in enumerate(layout["territories"]):
             draw_slot(territory_slot, f"Territory {i + 1}", self.TABLE_COLOR, self.BORDER_COLOR)
 
-        canvas.create_line(
-            10,
-            layout["territories"][0][1] - 6,
-            canvas.winfo_width() - 10,
-            layout["territories"][0][1] - 6,
-            fill=self.BORDER_COLOR,
-            dash=(4, 4),
-        )
+        line_y = layout["territories"][0][1] - 6
+        for dash_x in range(10, canvas_w - 10, 8):
+            draw.line((dash_x, line_y, min(dash_x + 4, canvas_w - 10), line_y), fill=self.BORDER_COLOR)
+        return image
+
+    def _update_zone_counts(self, canvas: tk.Canvas, idx: int, player: PlayerState) -> None:
+        labels = self._bf_zone_labels.get(idx, {})
+        counts = {
+            "deck": f"Deck ({len(player.deck)})",
+            "discard": f"Discard ({len(getattr(player, 'discard_pile', []))})",
+        }
+        for name, text in counts.items():
+            item = labels.get(name)
+            if item and item[1] != text:
+                canvas.itemconfigure(item[0], text=text)
+                labels[name] = (item[0], text)
 
     def _draw_card_at(
-        self, canvas: tk.Canvas, card: Card, x: float, y: float, width: float, height: float, tag: str
-    ) -> None:
-        shadow = canvas.create_rectangle(
-            x + 6,
-            y + 8,
-            x + width + 6,
-            y + height + 8,
-            fill=self.SHADOW_COLOR,
-            outline="",
-        )
-        rect = canvas.create_rectangle(
-            x,
-            y,
-            x + width,
-            y + height,
-            fill=self.CARD_FACE,
-            outline=self.ACCENT_COLOR,
-            width=2,
-        )
-        canvas.create_rectangle(
-            x + 5,
-            y + 5,
-            x + width - 5,
-            y + height - 5,
-            fill=self.CARD_INNER,
-            outline=self.BORDER_COLOR,
-            width=1,
-        )
-        canvas.create_rectangle(
-            x + 8,
-            y + 8,
-            x + width - 8,
-            y + 30,
-            fill=self.CARD_TYPE_STRIP,
-            outline=self.ACCENT_COLOR,
-            width=1,
-        )
-        canvas.create_text(
-            x + 12,
-            y + 19,
-            anchor="w",
-            text=card.name,
-            font=("Arial", 10, "bold"),
-            fill=self.TEXT_COLOR,
-        )
-        if card.cost_belief or card.cost_fear:
-            cost_text = self._format_cost(card)
-            canvas.create_text(
-                x + width - 10,
-                y + 19,
-                anchor="e",
-                text=cost_text,
-                font=self._get_font("Arial", 9, "bold"),
-                fill=self.SECONDARY_ACCENT,
-            )
-        art_image = self._get_card_image(card, int(width * 0.65), 65)
-        art_top = y + 36
-        art_height = 70
-        canvas.create_rectangle(
-            x + 10,
-            art_top,
-            x + width - 10,
-            art_top + art_height,
-            fill=self.PANEL_COLOR,
-            outline=self.BORDER_COLOR,
-        )
-        if art_image:
-            canvas.create_image(x + width / 2, art_top + art_height / 2, image=art_image)
-        desc_y = art_top + art_height + 6
-        canvas.create_text(
-            x + 12,
-            desc_y,
-            anchor="nw",
-            text=card.text[:70] + ("..." if len(card.text) > 70 else ""),
-            width=width - 24,
-            font=self._get_font("Arial", 9),
-            fill=self.MUTED_TEXT,
-        )
-        stats_y = desc_y + 32
-        canvas.create_rectangle(
-            x + 10,
-            stats_y,
-            x + width - 10,
-            stats_y + 24,
-            fill=self.FACTION_BANNER,
-            outline=self.ACCENT_COLOR,
-            width=1,
-        )
-        if isinstance(card, Cryptid):
-            canvas.create_text(
+        self, batch: _CanvasBatch, card: Card, x: float, y: float, width: float, height: float, tag: str
+    ) -> tuple[Optional[int], Optional[ImageTk.PhotoImage]]:
+        """Queue a battlefield card tagged ``tag`` as one pre-rendered image.
+
+        Cryptid stats stay a separate text item so HP changes are a single itemconfigure.
+        Returns the batch position of that text (or None) and the image, which the caller
+        must keep referenced for as long as the item is shown.
+        """
+
+        surface = self._card_surface(card, int(width), int(height))
+        batch.create_image(x, y, anchor="nw", image=surface, tags=(tag,))
+        if card.type is CardType.CRYPTID:
+            stats_y = y + 144
+            position = batch.create_text(
                 x + width / 2,
                 stats_y + 12,
-                text=f"PWR {card.stats.power}  DEF {card.stats.defense}  HP {card.current_health}/{card.stats.health}",
-                font=self._get_font("Arial", 9, "bold"),
-                fill=self.TEXT_COLOR,
-            )
-        elif isinstance(card, GodCard):
-            canvas.create_text(
-                x + width / 2,
-                stats_y + 12,
-                text=card.prayer_text or "Divinity",
+                text=self._stats_text(card),
                 font=self._get_font("Arial", 9, "bold"),
                 fill=self.TEXT_COLOR,
+                tags=(tag,),
             )
-        else:
-            canvas.create_text(
-                x + width / 2,
-                stats_y + 12,
-                text="Support",
-                font=self._get_font("Arial", 9, "bold"),
-                fill=self.TEXT_COLOR,
+            return position, surface
+        return None, surface
+
+    def _card_surface(self, card: Card, width: int, height: int) -> ImageTk.PhotoImage:
+        key = (card.name, width, height)
+        cache = self._card_surface_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            surface = ImageTk.PhotoImage(self._render_card_surface(card, width, height))
+            self._evict_oldest(cache, self.CARD_SURFACE_CACHE_SIZE)
+        cache[key] = surface
+        return surface
+
+    def _render_card_surface(self, card: Card, width: int, height: int) -> Image.Image:
+        """Paint the static parts of a battlefield card (everything but Cryptid stats) with Pillow."""
+
+        image = Image.new("RGBA", (width + 6, height + 8), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((6, 8, width + 6, height + 8), fill=self.SHADOW_COLOR)
+        draw.rectangle((0, 0, width, height), fill=self.CARD_FACE, outline=self.ACCENT_COLOR, width=2)
+        draw.rectangle((5, 5, width - 5, height - 5), fill=self.CARD_INNER, outline=self.BORDER_COLOR, width=1)
+        draw.rectangle((8, 8, width - 8, 30), fill=self.CARD_TYPE_STRIP, outline=self.ACCENT_COLOR, width=1)
+        draw.text((12, 19), card.name, font=_pil_font(10, True), fill=self.TEXT_COLOR, anchor="lm")
+        if card.cost_belief or card.cost_fear:
+            draw.text(
+                (width - 10, 19),
+                self._format_cost(card),
+                font=_pil_font(9, True),
+                fill=self.SECONDARY_ACCENT,
+                anchor="rm",
             )
-        canvas.itemconfigure(rect, tags=(tag,))
+
+        art_top = 36
+        art_height = 70
+        draw.rectangle((10, art_top, width - 10, art_top + art_height), fill=self.PANEL_COLOR, outline=self.BORDER_COLOR)
+        art = self._load_card_art(card, int(width * 0.65), 65)
+        if art is not None:
+            offset = ((width - art.width) // 2, art_top + (art_height - art.height) // 2)
+            if art.mode == "RGBA":
+                image.alpha_composite(art, offset)
+            else:
+                image.paste(art, offset)
+
+        desc_y = art_top + art_height + 6
+        body_font = _pil_font(9)
+        line_height = body_font.size + 3
+        stats_y = art_top + art_height + 38
+        for line in _wrap_pil_text(draw, card.display_blurb, body_font, width - 24):
+            if desc_y + line_height > stats_y:
+                break
+            draw.text((12, desc_y), line, font=body_font, fill=self.MUTED_TEXT)
+            desc_y += line_height
+
+        draw.rectangle((10, stats_y, width - 10, stats_y + 24), fill=self.FACTION_BANNER, outline=self.ACCENT_COLOR)
+        if card.type is not CardType.CRYPTID:
+            label = (card.prayer_text or "Divinity") if card.type is CardType.GOD else "Support"
+            draw.text((width / 2, stats_y + 12), label, font=_pil_font(9, True), fill=self.TEXT_COLOR, anchor="mm")
+        return image
 
     def _draw_territory_tile(
-        self, canvas: tk.Canvas, territory: object, x: float, y: float, width: float, height: float
+        self, batch: _CanvasBatch, territory: object, x: float, y: float, width: float, height: float, tag: str
     ) -> None:
         name = getattr(territory, "name", "Territory")
-        canvas.create_rectangle(x, y, x + width, y + height, fill=self.TABLE_COLOR, outline=self.ACCENT_COLOR, width=2)
-        canvas.create_rectangle(
+        batch.create_rectangle(
+            x, y, x + width, y + height, fill=self.TABLE_COLOR, outline=self.ACCENT_COLOR, width=2, tags=(tag,)
+        )
+        batch.create_rectangle(
             x + 4,
             y + 4,
             x + width - 4,
             y + height - 4,
             fill=self.PANEL_COLOR,
             outline=self.BORDER_COLOR,
+            tags=(tag,),
         )
-        canvas.create_text(
+        batch.create_text(
             x + width / 2,
             y + height / 2,
             text=name,
             fill=self.TEXT_COLOR,
-            font=("Arial", 10, "bold"),
+            font=self._get_font("Arial", 10, "bold"),
+            tags=(tag,),
         )
 
     def _draw_drop_zone(self, idx: int, layout: dict[str, object]) -> None:
         canvas = self.battlefield_canvases[idx]
-        canvas.update_idletasks()
-        frame_slots = [layout["active"], *layout["bench"], *layout["territories"]]
-        x1 = min(slot[0] for slot in frame_slots) - 18
-        y1 = min(slot[1] for slot in frame_slots) - 18
-        x2 = max(slot[2] for slot in frame_slots) + 18
-        y2 = max(slot[3] for slot in frame_slots) + 18
+        x1, y1, x2, y2 = _slot_extent((layout["active"], *layout["bench"], *layout["territories"]), 18)
         rect_tag = f"drop_zone_{idx}_rect"
         label_tag = f"drop_zone_{idx}_label"
-        self._clear_drop_zone_gradient(idx)
+        existing = self.drop_zone_items.get(idx)
+        if existing and canvas.type(existing[0]) and self.drop_zone_boxes.get(idx) == (x1, y1, x2, y2):
+            # Same geometry and the items are still on the canvas: nothing to redraw, and
+            # _render_battlefield clears any highlight left on them
+            return
         self._clear_drop_zone_tooltip(idx)
         self._clear_drop_zone_slots(idx)
         if idx in self.drop_zone_items:
@@ -632,6 +1143,7 @@ class GameGUI:
             canvas.delete(label_id)
 
         playmat_image = self._get_playmat_image(int(x2 - x1), int(y2 - y1))
+        self._pin_image(f"playmat_{idx}", playmat_image)
         if playmat_image:
             bg_id = canvas.create_image(x1, y1, anchor="nw", image=playmat_image)
             self.drop_zone_background_items[idx] = bg_id
@@ -639,6 +1151,13 @@ class GameGUI:
         else:
             self.drop_zone_slot_items[idx] = []
 
+        tint_w, tint_h = int(x2 - x1) - 4, int(y2 - y1) - 4
+        tint_color = self._blend_color(self.TABLE_COLOR, "#000000", 0.35)
+        tint = self._tint_image(tint_color, tint_w, tint_h)
+        self._pin_image(f"tint_{idx}", tint)
+        tint_id = canvas.create_image(x1 + 2, y1 + 2, anchor="nw", image=tint, tags=(rect_tag,))
+        self.drop_zone_slot_items[idx].append(tint_id)
+        self._drop_zone_tints[idx] = (tint_id, tint_w, tint_h, tint_color)
         rect_id = canvas.create_rectangle(
             x1 + 2,
             y1 + 2,
@@ -647,8 +1166,6 @@ class GameGUI:
             dash=(),
             outline=self.ACCENT_COLOR,
             width=2,
-            fill=self._blend_color(self.TABLE_COLOR, "#000000", 0.35),
-            stipple="gray50",
             tags=(rect_tag,),
         )
 
@@ -662,37 +1179,34 @@ class GameGUI:
             tag: str,
         ) -> None:
             x_a, y_a, x_b, y_b = coords
+            tint_w, tint_h = max(int(x_b - x_a), 1), max(int(y_b - y_a), 1)
+            tint = self._tint_image(fill, tint_w, tint_h)
+            self._pin_image(f"tint_{tag}", tint)
+            # The tint carries the slot tags too: an unfilled rectangle only hit-tests on its outline
+            tint_id = canvas.create_image(x_a, y_a, anchor="nw", image=tint, tags=(tag, self.SLOT_TAG))
             rect = canvas.create_rectangle(
                 x_a,
                 y_a,
                 x_b,
                 y_b,
-                fill=fill,
                 outline=outline,
                 width=2,
                 dash=(4, 2),
-                stipple="gray50",
-                tags=(tag,),
+                tags=(tag, self.SLOT_TAG),
             )
             text = canvas.create_text(
                 (x_a + x_b) / 2,
                 y_a + 14,
                 text=label,
                 fill=self.TEXT_COLOR,
-                font=("Arial", 10, "bold"),
-                tags=(tag,),
+                font=self._get_font("Arial", 10, "bold"),
+                tags=(tag, self.SLOT_TAG),
             )
-            slot_items.extend([rect, text])
-            hover_fill = self._blend_color(fill, "#ffffff", 0.18)
-            canvas.tag_bind(tag, "<Enter>", lambda _e, r=rect, f=hover_fill: canvas.itemconfigure(r, fill=f))
-            canvas.tag_bind(tag, "<Leave>", lambda _e, r=rect, f=fill: canvas.itemconfigure(r, fill=f))
-
-        territory_band = (
-            min(slot[0] for slot in layout["territories"]) - 6,
-            min(slot[1] for slot in layout["territories"]) - 6,
-            max(slot[2] for slot in layout["territories"]) + 6,
-            max(slot[3] for slot in layout["territories"]) + 6,
-        )
+            slot_items.extend([tint_id, rect, text])
+            hover = self._blend_color(fill, "#ffffff", 0.18)
+            self._slot_colors[tag] = (tint_id, tint_w, tint_h, fill, hover)
+
+        territory_band = _slot_extent(layout["territories"], 6)
         add_slot_overlay(
             territory_band,
             "Territory / Land Row",
@@ -722,7 +1236,7 @@ class GameGUI:
             (x1 + x2) / 2,
             y1 + 16,
             text="Ritual playmat — drop cards onto matching zones",
-            font=("Arial", 11, "bold"),
+            font=self._get_font("Arial", 11, "bold"),
             fill=self.TEXT_COLOR,
             tags=(label_tag,),
         )
@@ -730,8 +1244,12 @@ class GameGUI:
         self.drop_zone_glow_items[idx] = []
         self.drop_zone_boxes[idx] = (x1, y1, x2, y2)
         self.drop_zone_items[idx] = (rect_id, label_id)
+        self._screen_bounds_stale = True
 
     def _refresh_drop_zone_bounds(self) -> None:
+        if not self._screen_bounds_stale:
+            return
+        self._screen_bounds_stale = False
         for idx, canvas in enumerate(self.battlefield_canvases):
             if idx not in self.drop_zone_boxes:
                 continue
@@ -739,6 +1257,20 @@ class GameGUI:
             root_x, root_y = canvas.winfo_rootx(), canvas.winfo_rooty()
             self.drop_zone_screen_bounds[idx] = (root_x + x1, root_y + y1, root_x + x2, root_y + y2)
 
+    def _on_slot_hover(self, event: tk.Event, entering: bool) -> None:
+        canvas = event.widget
+        for tag in canvas.gettags("current"):
+            colors = self._slot_colors.get(tag)
+            if colors is not None:
+                tint_id, width, height, base, hover = colors
+                tint = self._tint_image(hover if entering else base, width, height)
+                self._pin_image(f"tint_{tag}", tint)
+                canvas.itemconfigure(tint_id, image=tint)
+                return
+
+    def _on_root_configure(self, _event: tk.Event) -> None:
+        self._screen_bounds_stale = True
+
     def _clear_drop_zone_tooltip(self, idx: int) -> None:
         ids = self.drop_zone_tooltips.pop(idx, None)
         if not ids:
@@ -775,72 +1307,95 @@ class GameGUI:
             y2 - 19,
             text=text,
             fill=color or self.ALERT_COLOR,
-            font=("Arial", 9, "bold"),
+            font=self._get_font("Arial", 9, "bold"),
         )
         self.drop_zone_tooltips[idx] = (tip_bg, tip_text)
         canvas.after(1400, lambda idx=idx: self._clear_drop_zone_tooltip(idx))
 
-    def _clear_drop_zone_gradient(self, idx: int) -> None:
-        canvas = self.battlefield_canvases[idx]
-        for item_id in self.drop_zone_gradient_items.get(idx, []):
-            canvas.delete(item_id)
-        self.drop_zone_gradient_items[idx] = []
-
     def _clear_drop_zone_glow(self, idx: int) -> None:
         canvas = self.battlefield_canvases[idx]
         for item_id in self.drop_zone_glow_items.get(idx, []):
             canvas.delete(item_id)
         self.drop_zone_glow_items[idx] = []
+        self._pin_image(f"glow_{idx}", None)
+
+    def _tint_image(self, color: str, width: int, height: int) -> ImageTk.PhotoImage:
+        """Half-transparent ``color`` block that darkens the playmat without hiding it.
+
+        Stands in for the old gray50 stipple, which is a slow path on X11.
+        """
+
+        key = (color, width, height)
+        cache = self._tint_cache
+        tint = cache.pop(key, None)
+        if tint is None:
+            rgba = (*_hex_to_rgb(color), self.OVERLAY_ALPHA)
+            tint = ImageTk.PhotoImage(Image.new("RGBA", (max(width, 1), max(height, 1)), rgba))
+            self._evict_oldest(cache, self.TINT_CACHE_SIZE)
+        cache[key] = tint
+        return tint
+
+    def _set_drop_zone_tint(self, idx: int, color: str) -> None:
+        state = self._drop_zone_tints.get(idx)
+        if state is None or state[3] == color:
+            return
+        tint_id, width, height, _ = state
+        tint = self._tint_image(color, width, height)
+        self._pin_image(f"tint_{idx}", tint)
+        self.battlefield_canvases[idx].itemconfigure(tint_id, image=tint)
+        self._drop_zone_tints[idx] = (tint_id, width, height, color)
 
     @staticmethod
     def _blend_color(base: str, mix: str, ratio: float) -> str:
-        def to_rgb(value: str) -> tuple[int, int, int]:
-            value = value.lstrip("#")
-            return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
-
-        base_r, base_g, base_b = to_rgb(base)
-        mix_r, mix_g, mix_b = to_rgb(mix)
-        r = int(base_r * (1 - ratio) + mix_r * ratio)
-        g = int(base_g * (1 - ratio) + mix_g * ratio)
-        b = int(base_b * (1 - ratio) + mix_b * ratio)
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    def _create_vertical_gradient(
-        self, canvas: tk.Canvas, x1: int, y1: int, x2: int, y2: int, start: str, end: str, steps: int = 16
-    ) -> list[int]:
-        items: list[int] = []
-        height = y2 - y1
-        for i in range(steps):
-            ratio = i / max(steps - 1, 1)
-            color = self._blend_color(start, end, ratio)
-            rect = canvas.create_rectangle(x1, y1 + (height / steps) * i, x2, y1 + (height / steps) * (i + 1), outline="", fill=color)
-            items.append(rect)
-        return items
+        # Quantized so hover/glow animations keep hitting the same cache entries
+        return _blend_hex(base, mix, round(ratio, 3))
 
     def _get_playmat_image(self, max_width: int, max_height: int) -> Optional[tk.PhotoImage]:
-        path = Path("assets/board/playmat_portal.png")
-        if not path.exists():
+        source = self._get_playmat_source()
+        if source is None:
             return None
 
-        cache_key = (str(path), max_width, max_height)
-        if cache_key in self._playmat_image_cache:
-            return self._playmat_image_cache[cache_key]
+        cache_key = (PLAYMAT_PATH, max_width, max_height)
+        cache = self._playmat_image_cache
+        tk_img = cache.pop(cache_key, None)
+        if tk_img is None:
+            width, height = source.size
+            target_w = max(max_width, 1)
+            target_h = max(max_height, 1)
+            scale = max(target_w / width, target_h / height)
+            new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            resized = source.resize(new_size, Image.BILINEAR)
+            tk_img = ImageTk.PhotoImage(resized.crop((0, 0, target_w, target_h)))
+            self._evict_oldest(cache, self.PLAYMAT_CACHE_SIZE)
+        cache[cache_key] = tk_img
+        return tk_img
 
-        try:
-            image = Image.open(path).convert("RGBA")
-        except (OSError, FileNotFoundError):
-            return None
+    def _get_playmat_source(self) -> Optional[Image.Image]:
+        """Decode the playmat once and keep it in memory; the file handle is closed right away."""
 
-        width, height = image.size
-        target_w = max(max_width, 1)
-        target_h = max(max_height, 1)
-        scale = max(target_w / width, target_h / height)
-        new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
-        resized = image.resize(new_size, Image.LANCZOS)
-        cropped = resized.crop((0, 0, target_w, target_h))
-        tk_img = ImageTk.PhotoImage(cropped)
-        self._playmat_image_cache[cache_key] = tk_img
-        return tk_img
+        if not self._playmat_loaded:
+            self._playmat_loaded = True
+            path = Path(PLAYMAT_PATH)
+            if path.exists():
+                try:
+                    with Image.open(path) as image:
+                        self._playmat_source = image.convert("RGBA")
+                except OSError:
+                    self._playmat_source = None
+        return self._playmat_source
+
+    @staticmethod
+    def _evict_oldest(cache: dict, limit: int) -> None:
+        # Caches are kept in recency order (hits are re-inserted), so the first key is the LRU one.
+        # Images still on screen stay alive through _pinned_images.
+        while len(cache) >= limit:
+            del cache[next(iter(cache))]
+
+    def _pin_image(self, slot: str, image: Optional[tk.PhotoImage]) -> None:
+        if image is None:
+            self._pinned_images.pop(slot, None)
+        else:
+            self._pinned_images[slot] = image
 
     def _apply_drop_zone_glow(self, idx: int, base_color: str) -> None:
         if idx not in self.drop_zone_boxes:
@@ -848,113 +1403,120 @@ class GameGUI:
         canvas = self.battlefield_canvases[idx]
         self._clear_drop_zone_glow(idx)
         x1, y1, x2, y2 = self.drop_zone_boxes[idx]
-        steps = 5
-        items: list[int] = []
-        for i in range(steps):
-            ratio = (i + 1) / (steps + 1)
-            color = self._blend_color(base_color, "#ffffff", ratio * 0.6)
-            inset = 2 + i * 3
-            rect = canvas.create_rectangle(
-                x1 + inset,
-                y1 + inset,
-                x2 - inset,
-                y2 - inset,
-                fill=color,
-                outline="",
+        glow = self._glow_image(base_color, int(x2 - x1) - 4, int(y2 - y1) - 4)
+        self._pin_image(f"glow_{idx}", glow)
+        self.drop_zone_glow_items[idx] = [canvas.create_image(x1 + 2, y1 + 2, anchor="nw", image=glow)]
+
+    def _glow_image(self, base_color: str, width: int, height: int) -> ImageTk.PhotoImage:
+        key = (base_color, width, height)
+        cache = self._glow_image_cache
+        glow = cache.pop(key, None)
+        if glow is None:
+            glow = ImageTk.PhotoImage(self._render_glow(base_color, max(width, 1), max(height, 1)))
+            self._evict_oldest(cache, self.GLOW_CACHE_SIZE)
+        cache[key] = glow
+        return glow
+
+    @staticmethod
+    def _render_glow(base_color: str, width: int, height: int) -> Image.Image:
+        """Soft inner glow along the playmat edge; the middle stays transparent."""
+
+        image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        colors = _glow_colors(base_color, 5)
+        for i, color in enumerate(colors):
+            inset = i * 3
+            alpha = 220 - i * 40
+            draw.rectangle(
+                (inset, inset, width - 1 - inset, height - 1 - inset),
+                outline=(*_hex_to_rgb(color), alpha),
+                width=3,
             )
-            items.append(rect)
-        self.drop_zone_glow_items[idx] = items
+        return image.filter(ImageFilter.GaussianBlur(2))
 
     def _format_cost_text(self, card: Card) -> str:
-        parts: list[str] = []
-        if card.cost_belief:
-            parts.append(f"{card.cost_belief} Belief")
-        if card.cost_fear:
-            parts.append(f"{card.cost_fear} Fear")
-        return "Cost: " + (", ".join(parts) if parts else "Free")
+        return _cost_text(card.cost_fear, card.cost_belief)
 
     def _affordability_info(self, card: Optional[Card]) -> tuple[bool, str]:
         if not card:
             return True, ""
-        pool = self.game.players[self.human_index].resources
-        missing_fear = max(card.cost_fear - pool.fear, 0)
-        missing_belief = max(card.cost_belief - pool.belief, 0)
-        if not missing_fear and not missing_belief:
-            return True, "Affordable"
-        missing_parts = []
-        if missing_belief:
-            missing_parts.append(f"{missing_belief} Belief")
-        if missing_fear:
-            missing_parts.append(f"{missing_fear} Fear")
-        return False, f"Need {', '.join(missing_parts)}"
+        pool = self._human.resources
+        return _affordability(card.cost_fear, card.cost_belief, pool.fear, pool.belief)
 
     def _highlight_drop_zone(self, active_idx: Optional[int], card: Optional[Card] = None) -> None:
         if active_idx is None:
             for idx in list(self.drop_zone_tooltips.keys()):
                 self._clear_drop_zone_tooltip(idx)
-        for idx, items in self.drop_zone_items.items():
-            rect_id, label_id = items
-            canvas = self.battlefield_canvases[idx]
-            is_active = active_idx == idx
-            display_card = card if is_active else None
-            affordable, status = self._affordability_info(display_card)
-            if is_active and display_card:
-                cost_text = self._format_cost_text(display_card)
-                label = f"Release to play — {cost_text} ({status})"
-            else:
-                label = "Drop to play"
-            fill = self.SURFACE_COLOR
-            outline = self.SECONDARY_ACCENT
-            text_color = self.TEXT_COLOR
-            dash = (3, 2)
-            width = 1
-            if is_active:
-                if display_card and not affordable:
-                    fill = self.ALERT_COLOR
-                    outline = self.ALERT_COLOR
-                    text_color = self.BG_COLOR
-                    self._clear_drop_zone_glow(idx)
-                else:
-                    fill = self.SURFACE_COLOR
-                    outline = self.ACCENT_COLOR
-                    text_color = self.TEXT_COLOR
-                    self._apply_drop_zone_glow(idx, self.ACCENT_COLOR)
-                dash = ()
-                width = 3
+        active_affordable, active_status = self._affordability_info(card if active_idx is not None else None)
+        for idx in self.drop_zone_items:
+            if idx == active_idx:
+                self._style_drop_zone(idx, True, card, active_affordable, active_status)
             else:
-                self._clear_drop_zone_glow(idx)
-            canvas.itemconfigure(rect_id, fill=fill, outline=outline, dash=dash, width=width)
-            canvas.itemconfigure(label_id, fill=text_color, text=label)
+                self._style_drop_zone(idx)
+
+    def _style_drop_zone(
+        self,
+        idx: int,
+        is_active: bool = False,
+        card: Optional[Card] = None,
+        affordable: bool = True,
+        status: str = "",
+    ) -> None:
+        rect_id, label_id = self.drop_zone_items[idx]
+        canvas = self.battlefield_canvases[idx]
+        display_card = card if is_active else None
+        if is_active and display_card:
+            cost_text = self._format_cost_text(display_card)
+            label = f"Release to play — {cost_text} ({status})"
+        else:
+            label = "Drop to play"
+        # The rect id is part of the state so a rebuilt drop zone is always restyled
+        state = (rect_id, is_active, affordable or display_card is None, label)
+        if self._drop_zone_state.get(idx) == state:
+            return
+        self._drop_zone_state[idx] = state
+        if not is_active:
+            style, tint, text_color = self._DROP_STYLE_IDLE, self.SURFACE_COLOR, self.TEXT_COLOR
+            self._clear_drop_zone_glow(idx)
+        elif display_card and not affordable:
+            style, tint, text_color = self._DROP_STYLE_BLOCKED, self.ALERT_COLOR, self.BG_COLOR
+            self._clear_drop_zone_glow(idx)
+        else:
+            style, tint, text_color = self._DROP_STYLE_READY, self.SURFACE_COLOR, self.TEXT_COLOR
+            self._apply_drop_zone_glow(idx, self.ACCENT_COLOR)
+        canvas.itemconfigure(rect_id, **style)
+        self._set_drop_zone_tint(idx, tint)
+        canvas.itemconfigure(label_id, fill=text_color, text=label)
 
     def _animate_drop(self, idx: int) -> None:
-        if idx not in self.drop_zone_items:
+        tint = self._drop_zone_tints.get(idx)
+        if tint is None:
             return
-        rect_id, _ = self.drop_zone_items[idx]
         canvas = self.battlefield_canvases[idx]
-        original_fill = canvas.itemcget(rect_id, "fill")
-        pulse_colors = [self.ACCENT_COLOR, self.SECONDARY_ACCENT, str(original_fill)]
-
-        def step(colors: list[str]) -> None:
-            if not colors:
-                return
-            color = colors.pop(0)
-            canvas.itemconfigure(rect_id, fill=color)
-            canvas.after(90, lambda: step(colors))
-
-        step(pulse_colors)
-
-    def _get_card_image(self, card: Card, max_width: int, max_height: int) -> Optional[tk.PhotoImage]:
-        path = Path(card.asset_path())
-        if not path.exists():
-            return None
-
-        cache_key = (str(path), max_width, max_height)
-        if cache_key in self._image_cache:
-            return self._image_cache[cache_key]
-
-        try:
-            image = Image.open(path).convert("RGBA")
-        except (OSError, FileNotFoundError):
+        generation = self._drop_pulse_generation.get(idx, 0) + 1
+        self._drop_pulse_generation[idx] = generation
+        # A pulse cut short by this one never restored the tint, so keep the first resting colour
+        rest_color = self._drop_pulse_rest.setdefault(idx, tint[3])
+        pulse_colors = (self.ACCENT_COLOR, self.SECONDARY_ACCENT, rest_color)
+        for step, color in enumerate(pulse_colors):
+            final = step == len(pulse_colors) - 1
+            canvas.after(90 * step, self._pulse_drop_zone, idx, generation, color, final)
+
+    def _pulse_drop_zone(self, idx: int, generation: int, color: str, final: bool) -> None:
+        if self._drop_pulse_generation.get(idx) != generation:
+            return
+        self._set_drop_zone_tint(idx, color)
+        if final:
+            self._drop_pulse_rest.pop(idx, None)
+            # A successful drop leaves the zone in the ready style; settle it back to idle
+            # unless a new drag is already hovering it
+            if self.drag_state.hovered_target != idx:
+                self._style_drop_zone(idx)
+
+    @classmethod
+    def _load_card_art(cls, card: Card, max_width: int, max_height: int) -> Optional[Image.Image]:
+        image = _card_art_source(card.asset_path())
+        if image is None:
             return None
 
         width, height = image.size
@@ -962,443 +1524,408 @@ class GameGUI:
             scale = min(max_width / max(width, 1), max_height / max(height, 1))
             new_width = max(int(width * scale), 1)
             new_height = max(int(height * scale), 1)
-            image = image.resize((new_width, new_height), Image.LANCZOS)
-
-        tk_image = ImageTk.PhotoImage(image)
-        self._image_cache[cache_key] = tk_image
-        return tk_image
+            # Thumbnails are too small for Lanczos to show; only the detail view pays for it
+            small = max(max_width, max_height) <= cls.THUMBNAIL_MAX_SIZE
+            resample = Image.BILINEAR if small else Image.LANCZOS
+            image = image.resize((new_width, new_height), resample, reducing_gap=3.0)
+        return image
 
     def _get_font(self, family: str, size: int, weight: str = "normal") -> tkfont.Font:
-        key = (family, size, weight)
-        if key not in self._font_cache:
-            self._font_cache[key] = tkfont.Font(family=family, size=size, weight=weight)
-        return self._font_cache[key]
+        try:
+            return self._font_cache[(family, size, weight)]
+        except KeyError:
+            font = self._font_cache[(family, size, weight)] = tkfont.Font(family=family, size=size, weight=weight)
+            return font
+
+    def _build_drag_overlay(self) -> None:
+        """Create the borderless preview window once; drags only swap its image and move it."""
+
+        overlay = tk.Toplevel(self.root)
+        overlay.withdraw()
+        overlay.overrideredirect(True)
+        overlay.attributes("-topmost", True)
+        try:
+            overlay.attributes("-alpha", 0.9)
+        except tk.TclError:
+            pass
+        label = tk.Label(overlay, bg=self.BG_COLOR, bd=0, highlightthickness=0)
+        label.pack()
+        overlay.bind("<B1-Motion>", self._on_global_drag_motion)
+        overlay.bind("<ButtonRelease-1>", self._on_global_button_release)
+        self.drag_overlay = overlay
+        self.drag_overlay_label = label
 
     def _create_drag_preview(self, card: Optional[Card]) -> None:
         if not card:
             return
-        self._destroy_drag_preview()
         self.drag_overlay_card = card
-        self.root.update_idletasks()
-        root_w = max(self.root.winfo_width(), 1)
-        root_h = max(self.root.winfo_height(), 1)
-        root_x, root_y = self.root.winfo_rootx(), self.root.winfo_rooty()
-        self.drag_overlay = tk.Toplevel(self.root)
-        self.drag_overlay.overrideredirect(True)
-        self.drag_overlay.attributes("-topmost", True)
-        try:
-            self.drag_overlay.attributes("-alpha", 0.9)
-        except tk.TclError:
-            pass
-        try:
-            self.drag_overlay.attributes("-transparentcolor", "systemTransparent")
-            bg_color = "systemTransparent"
-        except tk.TclError:
-            bg_color = ""
-        self.drag_overlay.configure(bg=bg_color)
-        self.drag_overlay.geometry(f"{root_w}x{root_h}+{root_x}+{root_y}")
-        try:
-            canvas = tk.Canvas(
-                self.drag_overlay,
-                width=root_w,
-                height=root_h,
-                bg=bg_color or "white",
-                highlightthickness=0,
-            )
-        except tk.TclError:
-            canvas = tk.Canvas(self.drag_overlay, width=root_w, height=root_h, bg="white", highlightthickness=0)
-        canvas.pack(fill=tk.BOTH, expand=True)
-        self.drag_overlay_canvas = canvas
+        image = self._drag_preview_image(card)
+        self._pin_image("drag_preview", image)
+        self.drag_overlay_label.configure(image=image)
+        self.drag_overlay.deiconify()
         self.drag_overlay.lift()
-        self.drag_overlay.bind("<B1-Motion>", self._on_global_drag_motion)
-        self.drag_overlay.bind("<ButtonRelease-1>", self._on_global_button_release)
         self._move_drag_preview(self.root.winfo_pointerx(), self.root.winfo_pointery())
 
-    def _move_drag_preview(self, x_root: int, y_root: int) -> None:
-        if not self.drag_overlay or not self.drag_overlay_canvas or not self.drag_overlay_card:
-            return
-        self.root.update_idletasks()
-        root_w = max(self.root.winfo_width(), 1)
-        root_h = max(self.root.winfo_height(), 1)
-        root_x, root_y = self.root.winfo_rootx(), self.root.winfo_rooty()
-        self.drag_overlay.geometry(f"{root_w}x{root_h}+{root_x}+{root_y}")
-        self.drag_overlay.lift()
-        canvas = self.drag_overlay_canvas
-        canvas.configure(width=root_w, height=root_h)
-        canvas.delete("all")
+    def _drag_preview_image(self, card: Card) -> ImageTk.PhotoImage:
+        """The card's battlefield face at preview size, with Cryptid stats baked in."""
 
-        card_w = 170
-        card_h = 220
-        snap_x, snap_y = x_root, y_root
-        if self.drag_state.hovered_target is not None:
-            bounds = self.drop_zone_screen_bounds.get(self.drag_state.hovered_target)
-            if bounds:
-                snap_x = (bounds[0] + bounds[2]) / 2
-                snap_y = (bounds[1] + bounds[3]) / 2
-
-        local_x = snap_x - self.drag_overlay.winfo_rootx()
-        local_y = snap_y - self.drag_overlay.winfo_rooty()
-        x1 = local_x - card_w / 2
-        y1 = local_y - card_h / 2
-        x2 = x1 + card_w
-        y2 = y1 + card_h
-
-        header_font = self._get_font("Arial", 10, "bold")
-        body_font = self._get_font("Arial", 9)
-        tiny_font = self._get_font("Arial", 8, "bold")
-
-        canvas.create_rectangle(x1 + 6, y1 + 10, x2 + 6, y2 + 10, fill="#c4c8d4", outline="")
-        canvas.create_rectangle(x1, y1, x2, y2, fill="#f9fbff", outline="#6666aa", width=2)
-        canvas.create_rectangle(x1 + 6, y1 + 6, x2 - 6, y2 - 6, fill="#ffffff", outline="#a2a8c5", width=1)
-        canvas.create_rectangle(x1 + 6, y1 + 6, x2 - 6, y1 + 36, fill="#e7ecff", outline="",)
-        canvas.create_text(x1 + 12, y1 + 22, text=self.drag_overlay_card.name, anchor="w", font=header_font)
-
-        cost_x = x2 - 10
-        if self.drag_overlay_card.cost_belief:
-            canvas.create_oval(cost_x - 20, y1 + 10, cost_x - 6, y1 + 24, fill="#ffe8b3", outline="#c08000", width=1)
-            canvas.create_text(cost_x - 13, y1 + 17, text=str(self.drag_overlay_card.cost_belief), font=tiny_font, fill="#7a4a00")
-        if self.drag_overlay_card.cost_fear:
-            canvas.create_oval(cost_x - 20, y1 + 10, cost_x - 6, y1 + 24, fill="#c9b7f7", outline="#6540c2", width=1)
-            canvas.create_text(cost_x - 13, y1 + 17, text=str(self.drag_overlay_card.cost_fear), font=tiny_font, fill="#3a1b6f")
-
-        image = self._get_card_image(self.drag_overlay_card, 110, 80)
-        image_top = y1 + 44
-        image_height = 80
-        if image:
-            canvas.create_rectangle(x1 + 10, image_top, x2 - 10, image_top + image_height, fill="#eef1ff", outline="#d0d4ee")
-            canvas.create_image((x1 + x2) / 2, image_top + image_height / 2, image=image)
-
-        body_top = image_top + image_height + 6
-        text_block_height = 52
-        body_text = (self.drag_overlay_card.text or "")[:160]
-        canvas.create_text(
-            x1 + 12,
-            body_top,
-            anchor="nw",
-            text=body_text + ("..." if len(self.drag_overlay_card.text or "") > 160 else ""),
-            width=card_w - 24,
-            font=body_font,
+        card_w, card_h = self.DRAG_PREVIEW_SIZE
+        if card.type is not CardType.CRYPTID:
+            return self._card_surface(card, card_w, card_h)
+        image = self._render_card_surface(card, card_w, card_h)
+        ImageDraw.Draw(image).text(
+            (card_w / 2, 156), self._stats_text(card), font=_pil_font(9, True), fill=self.TEXT_COLOR, anchor="mm"
         )
+        return ImageTk.PhotoImage(image)
 
-        stats_top = body_top + text_block_height
-        if isinstance(self.drag_overlay_card, Cryptid):
-            stats = self.drag_overlay_card.stats
-            stat_box_height = 28
-            canvas.create_rectangle(x1 + 10, stats_top, x2 - 10, stats_top + stat_box_height, fill="#eef7ff", outline="#c3d8ff")
-            canvas.create_text(
-                (x1 + x2) / 2,
-                stats_top + stat_box_height / 2,
-                text=f"PWR {stats.power}  DEF {stats.defense}  HP {self.drag_overlay_card.current_health}/{stats.health}",
-                font=self._get_font("Arial", 9, "bold"),
-            )
-            move_top = stats_top + stat_box_height + 4
-            moves_to_show = self.drag_overlay_card.moves[:2]
-            for move in moves_to_show:
-                canvas.create_text(
-                    x1 + 12,
-                    move_top,
-                    anchor="nw",
-                    text=move.describe(),
-                    width=card_w - 24,
-                    font=self._get_font("Arial", 8),
-                )
-                move_top += 18
-        else:
-            canvas.create_rectangle(x1 + 10, stats_top, x2 - 10, stats_top + 28, fill="#f9f1ea", outline="#e2c7a6")
-            canvas.create_text(x1 + 12, stats_top + 8, anchor="nw", text="Support", font=self._get_font("Arial", 9, "bold"))
-
-        self.drag_overlay_bounds = (
-            int(self.drag_overlay.winfo_rootx() + x1),
-            int(self.drag_overlay.winfo_rooty() + y1),
-            int(self.drag_overlay.winfo_rootx() + x2),
-            int(self.drag_overlay.winfo_rooty() + y2),
-        )
+    def _move_drag_preview(self, x_root: int, y_root: int) -> None:
+        if not self.drag_overlay or not self.drag_overlay_card:
+            return
+        card_w, card_h = self.DRAG_PREVIEW_SIZE
+        snap_x, snap_y = x_root, y_root
+        bounds = self._hovered_zone_bounds
+        if bounds is not None:
+            snap_x = (bounds[0] + bounds[2]) / 2
+            snap_y = (bounds[1] + bounds[3]) / 2
+
+        x1 = int(snap_x - card_w / 2)
+        y1 = int(snap_y - card_h / 2)
+        overlay_bounds = (x1, y1, x1 + card_w, y1 + card_h)
+        if overlay_bounds == self.drag_overlay_bounds:
+            # Snapped onto a drop zone (or sub-pixel motion): the window is already there
+            return
+        self.drag_overlay.geometry(f"+{x1}+{y1}")
+        self.drag_overlay_bounds = overlay_bounds
 
     def _destroy_drag_preview(self) -> None:
+        # The window is kept for the next drag; hiding it is enough
         if self.drag_overlay:
-            self.drag_overlay.destroy()
-        self.drag_overlay = None
-        self.drag_overlay_canvas = None
+            self.drag_overlay.withdraw()
         self.drag_overlay_bounds = None
         self.drag_overlay_card = None
 
     def _update_hover_target(self, x_root: int, y_root: int) -> None:
-        target_idx: Optional[int] = None
+        # Runs on every motion event, so test against the zones snapshotted in _start_drag
+        last = self._last_hover_xy
+        if last is not None and abs(x_root - last[0]) + abs(y_root - last[1]) < 2:
+            return
+        self._last_hover_xy = (x_root, y_root)
         overlay_bounds = self.drag_overlay_bounds
-        for idx in (self.human_index,):
-            bounds = self.drop_zone_screen_bounds.get(idx)
-            if not bounds:
-                continue
-            if overlay_bounds and self._bounds_intersect(overlay_bounds, bounds):
-                target_idx = idx
-                break
-            x1, y1, x2, y2 = bounds
-            if x1 <= x_root <= x2 and y1 <= y_root <= y2:
+        target_idx = None
+        hovered_bounds = None
+        for idx, x1, y1, x2, y2 in self._drag_zone_cache:
+            if (x1 <= x_root <= x2 and y1 <= y_root <= y2) or (
+                overlay_bounds is not None and self._bounds_intersect(overlay_bounds, (x1, y1, x2, y2))
+            ):
                 target_idx = idx
+                hovered_bounds = (x1, y1, x2, y2)
                 break
+        self._hovered_zone_bounds = hovered_bounds
         if target_idx != self.drag_state.hovered_target:
             self.drag_state.hovered_target = target_idx
             self._highlight_drop_zone(target_idx, self.drag_overlay_card)
 
     def _render_hand(self, idx: int) -> None:
         canvas = self.hand_canvases[idx]
-        canvas.delete("all")
         player = self.game.players[idx]
-        self.card_tags = {key: value for key, value in self.card_tags.items() if key[0] != idx}
-        canvas.update_idletasks()
+        self.card_tags[idx].clear()
+
+        if self.selected_player_idx == idx:
+            # Follow the selected card to its current slot before drawing the outlines
+            if self.selected_card is None or self.selected_card not in player.hand:
+                self._clear_selection(rerender=False)
+            else:
+                self.selected_tag = self._hand_tag(idx, self.selected_card)
 
         hand_size = len(player.hand)
+        # tag -> (card id, x, y, health); unchanged cards keep their canvas items
+        retained = self._hand_items[idx]
+        frames = self._hand_frames[idx]
+        lifted = self._hand_lifted[idx]
+        in_hand = {self._hand_tag(idx, card) for card in player.hand}
+        for stale in [tag for tag in retained if tag not in in_hand]:
+            self._forget_hand_card(idx, stale)
         if hand_size == 0:
+            self._hand_highlight[idx] = None
             return
 
-        card_width = 150
-        card_height = 190
+        card_width, card_height = self.HAND_CARD_SIZE
         overlap = 70
-        start_x = max((canvas.winfo_width() - (card_width + overlap * (hand_size - 1))) / 2, 10)
+        start_x = max((self._hand_canvas_width(idx) - (card_width + overlap * (hand_size - 1))) / 2, 10)
         base_y = 18
         center_index = (hand_size - 1) / 2
 
-        header_font = self._get_font("Arial", 10, "bold")
-        body_font = self._get_font("Arial", 9)
-        tiny_font = self._get_font("Arial", 8, "bold")
+        batch = _CanvasBatch(canvas)
+        frame_positions: Dict[str, int] = {}
+        face_positions: Dict[str, int] = {}
+        shadow = self._shadow_image(card_width, card_height)
 
         for i, card in enumerate(player.hand):
             x = start_x + i * overlap
             y = base_y + abs(i - center_index) * 2
-            tag = f"hand_{idx}_{i}"
-            is_selected = self.selected_player_idx == idx and self.selected_tag == tag
-            is_hovered = self._hovered_hand_tag == tag
-            scale = 1.08 if (is_hovered or is_selected) else 1.0
-            lift = 14 if (is_hovered or is_selected) else 0
-
-            scaled_w = card_width * scale
-            scaled_h = card_height * scale
-            x_adjust = x - (scaled_w - card_width) / 2
-            y_adjust = y - lift - (scaled_h - card_height) / 2
-            shadow = canvas.create_rectangle(
-                x_adjust + 6,
-                y_adjust + 10,
-                x_adjust + scaled_w + 6,
-                y_adjust + scaled_h + 10,
-                fill=self.SHADOW_COLOR,
-                outline="",
-                tags=(tag,),
-            )
-            frame = canvas.create_rectangle(
-                x_adjust,
-                y_adjust,
-                x_adjust + scaled_w,
-                y_adjust + scaled_h,
-                fill=self.CARD_FACE,
-                outline=self.ACCENT_COLOR if is_selected else self.SECONDARY_ACCENT,
-                width=3 if is_selected else 2,
+            tag = self._hand_tag(idx, card)
+            self.card_tags[idx][tag] = card
+            # Cards are always drawn flat; _apply_hand_lift raises hovered/selected ones afterwards
+            signature = (id(card), x, y, getattr(card, "current_health", None))
+            previous = retained.get(tag)
+            if previous == signature:
+                batch.tag_raise(tag)
+                continue
+            if previous is not None and previous[0] == signature[0] and previous[3] == signature[3]:
+                # Same card shifted to a new fan position: move its items instead of redrawing
+                batch.move(tag, x - previous[1], y - previous[2])
+                batch.tag_raise(tag)
+                retained[tag] = signature
+                continue
+            if previous is not None:
+                canvas.delete(tag)
+            if self._hand_highlight.get(idx) == tag:
+                # The new frame is drawn unhighlighted; let _apply_hand_decorations restore it
+                self._hand_highlight[idx] = None
+            retained[tag] = signature
+            lifted.discard(tag)
+            batch.create_image(
+                x + card_width / 2 + 6,
+                y + card_height / 2 + 10,
+                image=shadow,
                 tags=(tag,),
             )
-            canvas.create_rectangle(
-                x_adjust + 6,
-                y_adjust + 6,
-                x_adjust + scaled_w - 6,
-                y_adjust + scaled_h - 6,
-                fill=self.CARD_INNER,
-                outline=self.BORDER_COLOR,
-                width=1,
+            face = self._hand_surface(card, card_width, card_height)
+            self._pin_image(tag, face)
+            face_positions[tag] = batch.create_image(x + card_width / 2, y, anchor="n", image=face, tags=(tag,))
+            # Outline only, on top of the face, so selection is a single itemconfigure
+            frame_positions[tag] = batch.create_rectangle(
+                x,
+                y,
+                x + card_width,
+                y + card_height,
+                outline=self.SECONDARY_ACCENT,
+                width=2,
                 tags=(tag,),
             )
+            batch.tag_raise(tag)
 
-            canvas.create_rectangle(
-                x_adjust + 6,
-                y_adjust + 6,
-                x_adjust + scaled_w - 6,
-                y_adjust + 34,
-                fill=self.CARD_TYPE_STRIP,
-                outline="",
-                tags=(tag,),
-            )
-            canvas.create_text(
-                x_adjust + 12,
-                y_adjust + 20,
-                text=card.name,
-                anchor="w",
-                font=header_font,
-                fill=self.TEXT_COLOR,
-                tags=(tag,),
-            )
+        # One Tcl round-trip for every new item and the z-order pass
+        results = batch.flush()
+        for tag, position in frame_positions.items():
+            frames[tag] = int(results[position])
+        for tag, position in face_positions.items():
+            self._hand_faces[idx][tag] = int(results[position])
+        self._apply_hand_decorations(idx)
+        self._apply_hand_lift(idx)
 
-            cost_x = x_adjust + scaled_w - 10
-            if card.cost_belief:
-                canvas.create_oval(
-                    cost_x - 20,
-                    y_adjust + 10,
-                    cost_x - 6,
-                    y_adjust + 24,
-                    fill="#f5e4b5",
-                    outline=self.ACCENT_COLOR,
-                    width=1,
-                    tags=(tag,),
-                )
-                canvas.create_text(
-                    cost_x - 13,
-                    y_adjust + 17,
-                    text=str(card.cost_belief),
-                    font=tiny_font,
-                    fill="#3a280c",
-                    tags=(tag,),
-                )
-                cost_x -= 22
-            if card.cost_fear:
-                canvas.create_oval(
-                    cost_x - 20,
-                    y_adjust + 10,
-                    cost_x - 6,
-                    y_adjust + 24,
-                    fill="#c8ddff",
-                    outline=self.SECONDARY_ACCENT,
-                    width=1,
-                    tags=(tag,),
-                )
-                canvas.create_text(
-                    cost_x - 13,
-                    y_adjust + 17,
-                    text=str(card.cost_fear),
-                    font=tiny_font,
-                    fill=self.BG_COLOR,
-                    tags=(tag,),
-                )
-
-            image = self._get_card_image(card, 100, 70)
-            image_top = y_adjust + 40
-            image_height = 70
-            if image:
-                canvas.create_rectangle(
-                    x_adjust + 10,
-                    image_top,
-                    x_adjust + scaled_w - 10,
-                    image_top + image_height,
-                    fill=self.PANEL_COLOR,
-                    outline=self.BORDER_COLOR,
-                    tags=(tag,),
-                )
-                canvas.create_image(
-                    x_adjust + scaled_w / 2,
-                    image_top + image_height / 2,
-                    image=image,
-                    tags=(tag,),
-                )
-            body_top = image_top + image_height + 6
-            text_block_height = 44
-            canvas.create_text(
-                x_adjust + 12,
-                body_top,
-                anchor="nw",
-                text=(card.text or "")[:120] + ("..." if len(card.text) > 120 else ""),
-                width=scaled_w - 24,
-                font=body_font,
-                fill=self.MUTED_TEXT,
-                tags=(tag,),
+    @staticmethod
+    def _hand_tag(idx: int, card: Card) -> str:
+        # Keyed by card identity so a card keeps its items when earlier cards leave the hand
+        return f"hand_{idx}_{id(card)}"
+
+    def _shadow_image(self, width: int, height: int) -> ImageTk.PhotoImage:
+        """Soft drop shadow for a ``width`` x ``height`` card, shared by every card of that size."""
+
+        shadow = self._shadow_image_cache.get((width, height))
+        if shadow is None:
+            pad = 8
+            image = Image.new("RGBA", (width + pad * 2, height + pad * 2), (0, 0, 0, 0))
+            ImageDraw.Draw(image).rounded_rectangle(
+                (pad, pad, pad + width, pad + height), radius=6, fill=(*_hex_to_rgb(self.SHADOW_COLOR), 210)
             )
+            shadow = ImageTk.PhotoImage(image.filter(ImageFilter.GaussianBlur(4)))
+            self._shadow_image_cache[(width, height)] = shadow
+        return shadow
 
-            stats_top = body_top + text_block_height
-            if isinstance(card, Cryptid):
-                stats = card.stats
-                stat_box_height = 26
-                canvas.create_rectangle(
-                    x_adjust + 10,
-                    stats_top,
-                    x_adjust + scaled_w - 10,
-                    stats_top + stat_box_height,
-                    fill=self.CARD_TYPE_STRIP,
-                    outline=self.ACCENT_COLOR,
-                    tags=(tag,),
-                )
-                canvas.create_text(
-                    x_adjust + scaled_w / 2,
-                    stats_top + stat_box_height / 2,
-                    text=f"PWR {stats.power}  DEF {stats.defense}  HP {card.current_health}/{stats.health}",
-                    font=self._get_font("Arial", 9, "bold"),
-                    fill=self.TEXT_COLOR,
-                    tags=(tag,),
-                )
-
-                move_top = stats_top + stat_box_height + 4
-                moves_to_show = card.moves[:2]
-                for move in moves_to_show:
-                    move_text = move.describe()
-                    canvas.create_text(
-                        x_adjust + 12,
-                        move_top,
-                        anchor="nw",
-                        text=move_text,
-                        width=scaled_w - 24,
-                        font=self._get_font("Arial", 8),
-                        fill=self.MUTED_TEXT,
-                        tags=(tag,),
-                    )
-                    move_top += 18
-            else:
-                canvas.create_rectangle(
-                    x_adjust + 10,
-                    stats_top,
-                    x_adjust + scaled_w - 10,
-                    stats_top + 26,
-                    fill=self.PANEL_COLOR,
-                    outline=self.BORDER_COLOR,
-                    tags=(tag,),
-                )
-                canvas.create_text(
-                    x_adjust + 12,
-                    stats_top + 6,
-                    anchor="nw",
-                    text="Support",
-                    font=self._get_font("Arial", 9, "bold"),
-                    fill=self.TEXT_COLOR,
-                    tags=(tag,),
-                )
-
-            self.card_tags[(idx, tag)] = card
-            canvas.tag_bind(tag, "<Button-1>", lambda e, t=tag, p=idx: self._select_card(p, t))
-            canvas.tag_bind(tag, "<ButtonPress-1>", lambda e, t=tag, p=idx: self._start_drag(e, p, t))
-            canvas.tag_bind(tag, "<B1-Motion>", lambda e, t=tag, p=idx: self._drag(e, p, t))
-            canvas.tag_bind(tag, "<ButtonRelease-1>", lambda e, t=tag, p=idx: self._end_drag(e, p, t))
-            canvas.tag_bind(tag, "<Enter>", lambda e, t=tag, p=idx: self._set_hover(t, p))
-            canvas.tag_bind(tag, "<Leave>", lambda e, t=tag, p=idx: self._clear_hover(t, p))
-            canvas.tag_raise(tag)
+    def _apply_hand_decorations(self, idx: int) -> None:
+        """Move the selection outline between card frames with itemconfigure instead of redrawing."""
 
+        canvas = self.hand_canvases[idx]
+        frames = self._hand_frames[idx]
+        wanted = self.selected_tag if self.selected_player_idx == idx else None
+        current = self._hand_highlight.get(idx)
+        if current == wanted:
+            return
+        if current in frames:
+            canvas.itemconfigure(frames[current], outline=self.SECONDARY_ACCENT, width=2)
+        if wanted in frames:
+            canvas.itemconfigure(frames[wanted], outline=self.ACCENT_COLOR, width=3)
+        self._hand_highlight[idx] = wanted if wanted in frames else None
+
+    def _forget_hand_card(self, idx: int, tag: str) -> None:
+        self.hand_canvases[idx].delete(tag)
+        self._hand_items[idx].pop(tag, None)
+        self._hand_frames[idx].pop(tag, None)
+        self._hand_faces[idx].pop(tag, None)
+        self._hand_lifted[idx].discard(tag)
+        if self._hand_highlight.get(idx) == tag:
+            self._hand_highlight[idx] = None
+        self._pin_image(tag, None)
+
+    def _apply_hand_lift(self, idx: int) -> None:
+        """Raise and enlarge the hovered/selected cards by transforming their existing items."""
+
+        retained = self._hand_items[idx]
+        lifted = self._hand_lifted[idx]
+        wanted = {self._hovered_hand_tag}
         if self.selected_player_idx == idx:
-            if self.selected_card is None or self.selected_card not in player.hand:
-                self._clear_selection()
+            wanted.add(self.selected_tag)
+        wanted.intersection_update(retained)
+        if wanted == lifted:
+            return
+        canvas = self.hand_canvases[idx]
+        card_width, card_height = self.HAND_CARD_SIZE
+        scale = self.HAND_LIFT_SCALE
+        # Images do not scale with the canvas, so the face is swapped for one painted at lifted size
+        for tag in lifted - wanted:
+            _, x, y, _ = retained[tag]
+            canvas.move(tag, 0, self.HAND_LIFT)
+            canvas.scale(tag, x + card_width / 2, y + card_height / 2, 1 / scale, 1 / scale)
+            self._set_hand_face(idx, tag, card_width, card_height)
+        for tag in wanted - lifted:
+            _, x, y, _ = retained[tag]
+            canvas.scale(tag, x + card_width / 2, y + card_height / 2, scale, scale)
+            canvas.move(tag, 0, -self.HAND_LIFT)
+            self._set_hand_face(idx, tag, round(card_width * scale), round(card_height * scale))
+        self._hand_lifted[idx] = wanted
+
+    def _set_hand_face(self, idx: int, tag: str, width: int, height: int) -> None:
+        card = self.card_tags[idx].get(tag)
+        face_id = self._hand_faces[idx].get(tag)
+        if card is None or face_id is None:
+            return
+        face = self._hand_surface(card, width, height)
+        self._pin_image(tag, face)
+        self.hand_canvases[idx].itemconfigure(face_id, image=face)
+
+    def _hand_surface(self, card: Card, width: int, height: int) -> ImageTk.PhotoImage:
+        key = (card.name, getattr(card, "current_health", None), width, height)
+        cache = self._hand_surface_cache
+        surface = cache.pop(key, None)
+        if surface is None:
+            surface = ImageTk.PhotoImage(self._render_hand_surface(card, width, height))
+            self._evict_oldest(cache, self.HAND_SURFACE_CACHE_SIZE)
+        cache[key] = surface
+        return surface
+
+    def _render_hand_surface(self, card: Card, width: int, height: int) -> Image.Image:
+        """Paint a hand card's face with Pillow; Cryptid moves run on below the card as before."""
+
+        image = Image.new("RGBA", (width, height + 72), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((0, 0, width, height), fill=self.CARD_FACE)
+        draw.rectangle((6, 6, width - 6, height - 6), fill=self.CARD_INNER, outline=self.BORDER_COLOR)
+        draw.rectangle((6, 6, width - 6, 34), fill=self.CARD_TYPE_STRIP)
+        draw.text((12, 20), card.name, font=_pil_font(10, True), fill=self.TEXT_COLOR, anchor="lm")
+
+        cost_x = width - 10
+        tiny_font = _pil_font(8, True)
+        for cost, fill, outline, text_fill in (
+            (card.cost_belief, "#f5e4b5", self.ACCENT_COLOR, "#3a280c"),
+            (card.cost_fear, "#c8ddff", self.SECONDARY_ACCENT, self.BG_COLOR),
+        ):
+            if cost:
+                draw.ellipse((cost_x - 20, 10, cost_x - 6, 24), fill=fill, outline=outline)
+                draw.text((cost_x - 13, 17), str(cost), font=tiny_font, fill=text_fill, anchor="mm")
+                cost_x -= 22
+
+        art = self._load_card_art(card, 100, 70)
+        if art is not None:
+            draw.rectangle((10, 40, width - 10, 110), fill=self.PANEL_COLOR, outline=self.BORDER_COLOR)
+            offset = ((width - art.width) // 2, 75 - art.height // 2)
+            if art.mode == "RGBA":
+                image.alpha_composite(art, offset)
             else:
-                new_index = player.hand.index(self.selected_card)
-                self.selected_tag = f"hand_{idx}_{new_index}"
-                self._apply_selection_highlight()
+                image.paste(art, offset)
+
+        body_font = _pil_font(9)
+        text_y = 116
+        for line in _wrap_pil_text(draw, _truncate(card.text or "", 120), body_font, width - 24):
+            draw.text((12, text_y), line, font=body_font, fill=self.MUTED_TEXT)
+            text_y += body_font.size + 3
+
+        stats_top = 160
+        if card.type is CardType.CRYPTID:
+            draw.rectangle((10, stats_top, width - 10, stats_top + 26), fill=self.CARD_TYPE_STRIP, outline=self.ACCENT_COLOR)
+            draw.text(
+                (width / 2, stats_top + 13), self._stats_text(card), font=_pil_font(9, True), fill=self.TEXT_COLOR, anchor="mm"
+            )
+            move_font = _pil_font(8)
+            move_top = stats_top + 30
+            for move in card.moves[:2]:
+                line_y = move_top
+                for line in _wrap_pil_text(draw, move.describe(), move_font, width - 24):
+                    draw.text((12, line_y), line, font=move_font, fill=self.MUTED_TEXT)
+                    line_y += move_font.size + 2
+                move_top = max(move_top + 18, line_y)
+        else:
+            draw.rectangle((10, stats_top, width - 10, stats_top + 26), fill=self.PANEL_COLOR, outline=self.BORDER_COLOR)
+            draw.text((12, stats_top + 6), "Support", font=_pil_font(9, True), fill=self.TEXT_COLOR)
+        return image
+
+    @staticmethod
+    def _hand_tag_under_pointer(canvas: tk.Canvas) -> Optional[str]:
+        for tag in canvas.gettags("current"):
+            if tag.startswith("hand_"):
+                return tag
+        return None
+
+    def _on_hand_press(self, event: tk.Event, player_idx: int) -> None:
+        tag = self._hand_tag_under_pointer(self.hand_canvases[player_idx])
+        if not tag:
+            return
+        # A press always selects; the detail popup grabs input, so it waits for the release
+        # when a drag can start and only opens if the card was not moved.
+        can_drag = self.active_index == player_idx == self.human_index
+        self._select_card(player_idx, tag, show_details=not can_drag)
+        if can_drag:
+            self._start_drag(event, player_idx, tag)
+
+    def _on_hand_drag(self, event: tk.Event, player_idx: int) -> None:
+        if self.drag_state.tag:
+            self._drag(event, player_idx, self.drag_state.tag)
+
+    def _on_hand_release(self, event: tk.Event, player_idx: int) -> None:
+        if self.drag_state.tag:
+            self._end_drag(event, player_idx, self.drag_state.tag)
+
+    def _on_hand_motion(self, event: tk.Event, player_idx: int) -> None:
+        tag = self._hand_tag_under_pointer(self.hand_canvases[player_idx])
+        if tag:
+            self._set_hover(tag, player_idx)
+        elif self._hovered_hand_tag:
+            self._clear_hover(self._hovered_hand_tag, player_idx)
+
+    def _on_hand_leave(self, player_idx: int) -> None:
+        if self._hovered_hand_tag:
+            self._clear_hover(self._hovered_hand_tag, player_idx)
 
     def _set_hover(self, tag: str, player_idx: int) -> None:
-        if player_idx != self.human_index:
+        # The hand is frozen while a card is being dragged out of it
+        if player_idx != self.human_index or self.drag_state.tag:
             return
         if self._hovered_hand_tag == tag:
             return
         self._hovered_hand_tag = tag
-        self._render_hand(player_idx)
+        self._apply_hand_lift(player_idx)
 
     def _clear_hover(self, tag: str, player_idx: int) -> None:
-        if self._hovered_hand_tag != tag:
+        if self._hovered_hand_tag != tag or self.drag_state.tag:
             return
         self._hovered_hand_tag = None
-        self._render_hand(player_idx)
+        self._apply_hand_lift(player_idx)
 
-    def _select_card(self, player_idx: int, tag: str) -> None:
+    def _select_card(self, player_idx: int, tag: str, show_details: bool = True) -> None:
         if player_idx != self.human_index:
             return
-        card = self.card_tags.get((player_idx, tag))
+        card = self.card_tags[player_idx].get(tag)
         if not card:
             self._clear_selection()
             return
-        self._clear_selection()
+        self._clear_selection(rerender=False)
         self.selected_card = card
         self.selected_player_idx = player_idx
         self.selected_tag = tag
         self._apply_selection_highlight()
         self._log(f"Selected {self.selected_card.name} from {self.game.players[player_idx].name}'s hand.")
-        self._show_card_details(card)
+        if show_details:
+            self._show_card_details(card)
 
     def _start_drag(self, event: tk.Event, player_idx: int, tag: str) -> None:
         if self.active_index != player_idx or player_idx != self.human_index:
@@ -1406,29 +1933,58 @@ class GameGUI:
         self.drag_state = DragState(player_index=player_idx, tag=tag, last_x=event.x, last_y=event.y)
         canvas = self.hand_canvases[player_idx]
         canvas.tag_raise(tag)
-        self._create_drag_preview(self.card_tags.get((player_idx, tag)))
         self._refresh_drop_zone_bounds()
+        bounds = self.drop_zone_screen_bounds.get(self.human_index)
+        self._drag_zone_cache = [(self.human_index, *bounds)] if bounds else []
+        self._hovered_zone_bounds = None
+        self._last_hover_xy = None
+        self._create_drag_preview(self.card_tags[player_idx].get(tag))
         self.root.bind("<B1-Motion>", self._on_global_drag_motion)
         self.root.bind("<ButtonRelease-1>", self._on_global_button_release)
 
     def _drag(self, event: tk.Event, player_idx: int, tag: str) -> None:
         if self.drag_state.tag != tag or self.drag_state.player_index != player_idx:
             return
-        canvas = self.hand_canvases[player_idx]
-        dx = event.x - self.drag_state.last_x
-        dy = event.y - self.drag_state.last_y
-        canvas.move(tag, dx, dy)
-        self.drag_state.last_x = event.x
-        self.drag_state.last_y = event.y
-        self._move_drag_preview(event.x_root, event.y_root)
-        self._update_hover_target(event.x_root, event.y_root)
+        self._queue_motion(event.x, event.y, event.x_root, event.y_root)
+
+    def _queue_motion(self, x: Optional[int], y: Optional[int], x_root: int, y_root: int) -> None:
+        """Keep only the latest pointer position and apply it at most once per DRAG_FRAME_MS."""
+
+        self._pending_motion = (x, y, x_root, y_root)
+        if not self._motion_scheduled:
+            self._motion_scheduled = True
+            self.root.after(self.DRAG_FRAME_MS, self._apply_motion)
+
+    def _apply_motion(self) -> None:
+        self._motion_scheduled = False
+        pending = self._pending_motion
+        self._pending_motion = None
+        tag = self.drag_state.tag
+        if pending is None or not tag or self.drag_state.player_index is None:
+            return
+        x, y, x_root, y_root = pending
+        if x is not None and y is not None:
+            dx = x - self.drag_state.last_x
+            dy = y - self.drag_state.last_y
+            if abs(dx) + abs(dy) < 2:
+                # Sub-pixel jitter: let it accumulate instead of issuing move/geometry calls
+                return
+            self.hand_canvases[self.drag_state.player_index].move(tag, dx, dy)
+            self.drag_state.moved = True
+            self.drag_state.last_x = x
+            self.drag_state.last_y = y
+        self._move_drag_preview(x_root, y_root)
+        self._update_hover_target(x_root, y_root)
 
     def _end_drag(self, event: tk.Event, player_idx: int, tag: str) -> None:
         if self.drag_state.tag != tag or self.drag_state.player_index != player_idx:
             return
-        card = self.card_tags.get((player_idx, tag))
+        card = self.card_tags[player_idx].get(tag)
         if not card:
             return
+        if self._pending_motion is not None:
+            # A release inside the frame window must drop where the pointer is now
+            self._apply_motion()
         should_reset_highlight = True
         if self.drag_state.hovered_target is not None:
             affordable, status = self._affordability_info(card)
@@ -1441,16 +1997,29 @@ class GameGUI:
         if should_reset_highlight:
             self._highlight_drop_zone(None)
         self._destroy_drag_preview()
-        self._render_hand(player_idx)
+        self._pending_motion = None
+        self._drag_zone_cache = []
+        self._hovered_zone_bounds = None
+        self._last_hover_xy = None
+        # The dragged items were moved off their slot, so drop them (and the player's render
+        # signature) and let the idle flush redraw that slot with any play that happened
+        self._forget_hand_card(player_idx, tag)
+        self._last_render_sig.pop(player_idx, None)
+        self._mark_dirty(player_idx)
+        moved = self.drag_state.moved
         self.drag_state = DragState()
         self.root.unbind("<B1-Motion>")
         self.root.unbind("<ButtonRelease-1>")
+        if not moved and self.selected_card is card:
+            self._show_card_details(card)
 
     def _on_global_drag_motion(self, event: tk.Event) -> None:
-        if not self.drag_state.tag:
+        if not self.drag_state.tag or self.drag_state.player_index is None:
             return
-        self._move_drag_preview(event.x_root, event.y_root)
-        self._update_hover_target(event.x_root, event.y_root)
+        if event.widget is self.hand_canvases[self.drag_state.player_index]:
+            # Already queued with canvas coordinates by _drag
+            return
+        self._queue_motion(None, None, event.x_root, event.y_root)
 
     def _on_global_button_release(self, event: tk.Event) -> None:
         if not self.drag_state.tag or self.drag_state.player_index is None:
@@ -1466,11 +2035,9 @@ class GameGUI:
     def draw_card(self) -> None:
         if not self._assert_human_turn():
             return
-        player = self.game.players[self.human_index]
-        messages = player.draw()
-        for msg in messages:
-            self._log(msg)
-        self._render_player(self.human_index)
+        player = self._human
+        self._log_many(player.draw())
+        self._mark_dirty(self.human_index)
 
     def play_selected(self) -> None:
         if not self.selected_card or self.selected_player_idx != self.human_index:
@@ -1492,59 +2059,35 @@ class GameGUI:
             self._log("Card is no longer in hand.")
             return False
 
-        message: Optional[str] = None
-        if isinstance(card, TerritoryCard):
-            player.hand.remove(card)
-            message = player.settle_territory_card(card, self.game.stack)
-        elif isinstance(card, Cryptid):
-            if not card.can_play(player.resources):
-                self._log(f"Cannot afford {card.name}.")
-                return False
-            player.hand.remove(card)
-            message = player.summon(card, self.game.stack)
-        elif isinstance(card, EventCard):
-            if not card.can_play(player.resources):
-                self._log(f"Cannot afford {card.name}.")
-                return False
-            player.hand.remove(card)
-            message = player.cast_event(card, self.game.stack)
-        elif isinstance(card, GodCard):
-            if not card.can_play(player.resources):
-                self._log(f"Cannot afford {card.name}.")
-                return False
-            player.hand.remove(card)
-            message = player.play_god(card, self.game.stack)
+        if card.type is not CardType.TERRITORY and not player.can_afford(card):
+            self._log(f"Cannot afford {card.name}.")
+            return False
+        player.hand.remove(card)
+        message = self._PLAY_DISPATCH[card.type](player, card, self.game.stack)
 
         if message:
             self._log(message)
         self.resolve_stack()
-        self._render_player(player_idx)
+        self._mark_dirty(player_idx)
         return True
 
     def _apply_selection_highlight(self) -> None:
-        if self.selected_player_idx is None or not self.selected_tag:
-            return
-        canvas = self.hand_canvases[self.selected_player_idx]
-        if canvas.find_withtag(self.selected_tag):
-            canvas.itemconfigure(self.selected_tag, outline=self.ACCENT_COLOR, width=3)
-
-    def _clear_selection(self) -> None:
-        if self.selected_player_idx is not None and self.selected_tag:
-            canvas = self.hand_canvases[self.selected_player_idx]
-            if canvas.find_withtag(self.selected_tag):
-                canvas.itemconfigure(self.selected_tag, outline=self.SECONDARY_ACCENT, width=1)
+        # Selected cards are lifted, so the hand pass repositions them; the outline itself is
+        # only an itemconfigure on the stored frame (see _apply_hand_decorations).
+        if self.selected_player_idx is not None:
+            self._render_hand(self.selected_player_idx)
+
+    def _clear_selection(self, rerender: bool = True) -> None:
+        previous_idx = self.selected_player_idx
         self.selected_card = None
         self.selected_player_idx = None
         self.selected_tag = None
         self._close_detail_window()
+        if rerender and previous_idx is not None:
+            self._render_hand(previous_idx)
 
     def _format_cost(self, card: Card) -> str:
-        parts = []
-        if card.cost_fear:
-            parts.append(f"{card.cost_fear} Fear")
-        if card.cost_belief:
-            parts.append(f"{card.cost_belief} Belief")
-        return ", ".join(parts) if parts else "Free"
+        return _cost_label(card.cost_fear, card.cost_belief)
 
     def _close_detail_window(self) -> None:
         if self.detail_window:
@@ -1552,39 +2095,29 @@ class GameGUI:
                 self.detail_window.grab_release()
             except tk.TclError:
                 pass
-            self.detail_window.destroy()
+            # Hidden rather than destroyed; _show_card_details repopulates it
+            self.detail_window.withdraw()
             self.detail_window = None
-        self._detail_focusable = []
 
-    def _show_card_details(self, card: Card) -> None:
-        self._close_detail_window()
-        self.root.update_idletasks()
-        root_w = max(self.root.winfo_width(), 1)
-        root_h = max(self.root.winfo_height(), 1)
-        root_x, root_y = self.root.winfo_rootx(), self.root.winfo_rooty()
+    def _build_detail_overlay(self) -> None:
+        """Create the card-detail overlay once; it is withdrawn until a card is shown."""
 
         overlay = tk.Toplevel(self.root)
+        overlay.withdraw()
         overlay.overrideredirect(True)
-        overlay.geometry(f"{root_w}x{root_h}+{root_x}+{root_y}")
         overlay.attributes("-topmost", True)
-        self.detail_window = overlay
 
-        canvas = tk.Canvas(overlay, width=root_w, height=root_h, highlightthickness=0)
+        canvas = tk.Canvas(overlay, highlightthickness=0)
         canvas.pack(fill=tk.BOTH, expand=True)
-        canvas.create_rectangle(0, 0, root_w, root_h, fill="#000000", outline="", stipple="gray50")
-
-        anchor_x, anchor_y = self._detail_anchor_position(root_x, root_y)
-
-        card_width, card_height = 360, 520
-        anchor_x = min(max(card_width / 2 + 12, anchor_x), root_w - card_width / 2 - 12)
-        anchor_y = min(max(card_height / 2 + 12, anchor_y), root_h - card_height / 2 - 12)
+        backdrop = canvas.create_rectangle(0, 0, 1, 1, fill="#000000", outline="", stipple="gray50")
 
         frame = tk.Frame(canvas, bg="#fefcf7", bd=0)
-        canvas.create_window(anchor_x, anchor_y, window=frame)
+        frame_item = canvas.create_window(0, 0, window=frame)
 
+        card_width, card_height = self.DETAIL_CARD_SIZE
         card_canvas = tk.Canvas(frame, width=card_width, height=card_height, bg="#fefcf7", highlightthickness=0)
         card_canvas.pack()
-        self._draw_full_card(card_canvas, card, card_width, card_height)
+        card_item = card_canvas.create_image(0, 0, anchor="nw")
 
         close_btn = tk.Button(frame, text="Close", command=self._close_detail_window)
         close_btn.pack(pady=(8, 0))
@@ -1600,111 +2133,152 @@ class GameGUI:
         overlay.bind("<KeyPress-Tab>", self._handle_overlay_tab)
         overlay.bind("<KeyPress-ISO_Left_Tab>", self._handle_overlay_tab)
         overlay.bind("<KeyPress-Escape>", lambda e: self._close_detail_window())
+
+        self._detail_overlay = overlay
+        self._detail_canvas = canvas
+        self._detail_backdrop = backdrop
+        self._detail_frame_item = frame_item
+        self._detail_card_canvas = card_canvas
+        self._detail_card_item = card_item
+
+    def _show_card_details(self, card: Card) -> None:
+        if self.drag_state.tag:
+            return
+        self._close_detail_window()
+        if self._detail_overlay is None:
+            self._build_detail_overlay()
+        root_w = max(self.root.winfo_width(), 1)
+        root_h = max(self.root.winfo_height(), 1)
+        root_x, root_y = self.root.winfo_rootx(), self.root.winfo_rooty()
+
+        overlay = self._detail_overlay
+        overlay.geometry(f"{root_w}x{root_h}+{root_x}+{root_y}")
+        canvas = self._detail_canvas
+        canvas.configure(width=root_w, height=root_h)
+        canvas.coords(self._detail_backdrop, 0, 0, root_w, root_h)
+
+        anchor_x, anchor_y = self._detail_anchor_position(root_x, root_y)
+
+        card_width, card_height = self.DETAIL_CARD_SIZE
+        anchor_x = min(max(card_width / 2 + 12, anchor_x), root_w - card_width / 2 - 12)
+        anchor_y = min(max(card_height / 2 + 12, anchor_y), root_h - card_height / 2 - 12)
+        canvas.coords(self._detail_frame_item, anchor_x, anchor_y)
+
+        self._draw_full_card(card, card_width, card_height)
+
+        overlay.deiconify()
+        overlay.lift()
+        self.detail_window = overlay
         overlay.grab_set()
-        close_btn.focus_set()
+        self._detail_focusable[0].focus_set()
 
     def _detail_anchor_position(self, root_x: int, root_y: int) -> tuple[float, float]:
         anchor_canvas = self.hand_canvases[self.active_index]
         if not anchor_canvas.winfo_ismapped():
             anchor_canvas = self.battlefield_canvases[self.active_index]
-        anchor_canvas.update_idletasks()
+        # A click can only land on a mapped, laid-out canvas, so its geometry is already current
         anchor_x = anchor_canvas.winfo_rootx() - root_x + anchor_canvas.winfo_width() / 2
         anchor_y = anchor_canvas.winfo_rooty() - root_y + anchor_canvas.winfo_height() / 2
         return anchor_x, anchor_y
 
-    def _draw_full_card(self, canvas: tk.Canvas, card: Card, width: int, height: int) -> None:
-        canvas.delete("all")
+    def _draw_full_card(self, card: Card, width: int, height: int) -> None:
+        # The detail canvas keeps one image item; showing another card only swaps its image
+        image = self._full_card_image(card, width, height)
+        self._pin_image("detail", image)
+        self._detail_card_canvas.itemconfigure(self._detail_card_item, image=image)
+
+    def _full_card_image(self, card: Card, width: int, height: int) -> ImageTk.PhotoImage:
+        key = (card.name, getattr(card, "current_health", None), width, height)
+        cache = self._full_card_cache
+        image = cache.pop(key, None)
+        if image is None:
+            image = ImageTk.PhotoImage(self._render_full_card(card, width, height))
+            self._evict_oldest(cache, self.FULL_CARD_CACHE_SIZE)
+        cache[key] = image
+        return image
+
+    def _render_full_card(self, card: Card, width: int, height: int) -> Image.Image:
+        """Paint the detail-view card with Pillow so reopening it is a single image item."""
+
+        image = Image.new("RGB", (width, height), "#f4ede2")
+        draw = ImageDraw.Draw(image)
         pad = 14
-        canvas.create_rectangle(0, 0, width, height, fill="#f4ede2", outline="#b4976a", width=2)
-        canvas.create_rectangle(6, 6, width - 6, height - 6, outline="#d1c4a4", width=1)
+        ink = "#000000"
+        draw.rectangle((0, 0, width - 1, height - 1), outline="#b4976a", width=2)
+        draw.rectangle((6, 6, width - 6, height - 6), outline="#d1c4a4", width=1)
 
-        name_font = self._get_font("Arial", 18, "bold")
-        body_font = self._get_font("Arial", 10)
-        italic_font = self._get_font("Arial", 10, "bold")
+        name_font = _pil_font(18, True)
+        body_font = _pil_font(10)
+        text_width = width - pad * 2
 
-        canvas.create_text(pad, pad, anchor="nw", text=card.name, font=name_font, fill="#2b1e08")
+        draw.text((pad, pad), card.name, font=name_font, fill="#2b1e08")
         type_cost = f"{card.type.name.title()} — Cost: {self._format_cost(card)}"
-        canvas.create_text(pad, pad + 28, anchor="nw", text=type_cost, font=self._get_font("Arial", 11))
+        draw.text((pad, pad + 28), type_cost, font=_pil_font(11), fill=ink)
 
         info_y = pad + 52
         if card.faction:
-            canvas.create_text(pad, info_y, anchor="nw", text=f"Faction: {card.faction}", font=body_font)
+            draw.text((pad, info_y), f"Faction: {card.faction}", font=body_font, fill=ink)
             info_y += 18
         if card.tags:
-            canvas.create_text(pad, info_y, anchor="nw", text=f"Tags: {', '.join(card.tags)}", font=body_font)
+            draw.text((pad, info_y), f"Tags: {', '.join(card.tags)}", font=body_font, fill=ink)
             info_y += 18
 
         art_height = 170
-        image = self._get_card_image(card, width - pad * 2, art_height)
-        if image:
-            canvas.create_rectangle(pad, info_y, width - pad, info_y + art_height, fill="#f7f9ff", outline="#d4d8e8")
-            canvas.create_image((width) / 2, info_y + art_height / 2, image=image)
+        art = self._load_card_art(card, text_width, art_height)
+        if art is not None:
+            draw.rectangle((pad, info_y, width - pad, info_y + art_height), fill="#f7f9ff", outline="#d4d8e8")
+            offset = ((width - art.width) // 2, int(info_y + (art_height - art.height) / 2))
+            if art.mode == "RGBA":
+                image.paste(art, offset, art)
+            else:
+                image.paste(art, offset)
         info_y += art_height + 12
 
         text_block = card.text or ""
-        if isinstance(card, EventCard) and card.impact_text:
+        if card.type is CardType.EVENT and card.impact_text:
             text_block = card.impact_text
-
         if text_block:
-            text_id = canvas.create_text(
-                pad,
-                info_y,
-                anchor="nw",
-                text=text_block,
-                width=width - pad * 2,
-                font=body_font,
-                justify=tk.LEFT,
-            )
-            bbox = canvas.bbox(text_id)
-            info_y = (bbox[3] + 12) if bbox else info_y + 72
-
-        if isinstance(card, TerritoryCard):
-            yields = []
-            if card.fear_yield:
-                yields.append(f"{card.fear_yield} Fear")
-            if card.belief_yield:
-                yields.append(f"{card.belief_yield} Belief")
-            yield_text = ", ".join(yields) if yields else "No yield"
-            canvas.create_text(pad, info_y, anchor="nw", text=f"Yields: {yield_text}", font=italic_font)
-            info_y += 22
-
-        if isinstance(card, Cryptid):
-            stats = card.stats
-            canvas.create_rectangle(pad, info_y, width - pad, info_y + 34, fill="#eef6ff", outline="#c6d9f2")
-            canvas.create_text(
-                width / 2,
-                info_y + 17,
-                text=f"PWR {stats.power}  DEF {stats.defense}  HP {card.current_health}/{stats.health}",
-                font=italic_font,
-                fill="#1c3e7a",
-            )
-            info_y += 42
-            if card.moves:
-                canvas.create_text(pad, info_y, anchor="nw", text="Moves", font=italic_font)
-                info_y += 18
-                for move in card.moves:
-                    canvas.create_text(
-                        pad,
-                        info_y,
-                        anchor="nw",
-                        text=move.describe(),
-                        width=width - pad * 2,
-                        font=body_font,
-                        justify=tk.LEFT,
-                    )
-                    info_y += 22
-
-        if isinstance(card, GodCard) and card.prayer_text:
-            canvas.create_text(
-                pad,
-                info_y,
-                anchor="nw",
-                text=f"Prayer: {card.prayer_text}",
-                width=width - pad * 2,
-                font=body_font,
-                justify=tk.LEFT,
-            )
-            info_y += 38
+            info_y = _draw_wrapped_pil(draw, text_block, pad, info_y, body_font, text_width, ink) + 12
+
+        section = self._DETAIL_SECTIONS.get(card.type)
+        if section is not None:
+            section(self, draw, card, info_y, width, pad)
+        return image
+
+    def _detail_yields(self, draw: ImageDraw.ImageDraw, card: Card, y: float, width: int, pad: int) -> float:
+        yields = []
+        if card.fear_yield:
+            yields.append(f"{card.fear_yield} Fear")
+        if card.belief_yield:
+            yields.append(f"{card.belief_yield} Belief")
+        yield_text = ", ".join(yields) if yields else "No yield"
+        draw.text((pad, y), f"Yields: {yield_text}", font=_pil_font(10, True), fill="#000000")
+        return y + 22
+
+    def _detail_stats(self, draw: ImageDraw.ImageDraw, card: Card, y: float, width: int, pad: int) -> float:
+        italic_font = _pil_font(10, True)
+        draw.rectangle((pad, y, width - pad, y + 34), fill="#eef6ff", outline="#c6d9f2")
+        draw.text((width / 2, y + 17), self._stats_text(card), font=italic_font, fill="#1c3e7a", anchor="mm")
+        y += 42
+        if card.moves:
+            draw.text((pad, y), "Moves", font=italic_font, fill="#000000")
+            y += 18
+            body_font = _pil_font(10)
+            for move in card.moves:
+                y = max(y + 22, _draw_wrapped_pil(draw, move.describe(), pad, y, body_font, width - pad * 2, "#000000"))
+        return y
+
+    def _detail_prayer(self, draw: ImageDraw.ImageDraw, card: Card, y: float, width: int, pad: int) -> float:
+        if card.prayer_text:
+            y = _draw_wrapped_pil(draw, f"Prayer: {card.prayer_text}", pad, y, _pil_font(10), width - pad * 2, "#000000")
+        return y
+
+    # Card-type specific block drawn below the rules text in the detail view
+    _DETAIL_SECTIONS = {
+        CardType.TERRITORY: _detail_yields,
+        CardType.CRYPTID: _detail_stats,
+        CardType.GOD: _detail_prayer,
+    }
 
     def _handle_overlay_tab(self, event: tk.Event) -> str:
         if not self.detail_window:
@@ -1725,68 +2299,86 @@ class GameGUI:
     def play_queued_territory(self) -> None:
         if not self._assert_human_turn():
             return
-        player = self.game.players[self.human_index]
+        player = self._human
         if not player.territory_queue:
             self._log("No queued territory to play.")
             return
-        territory = player.territory_queue.pop(0)
+        territory = player.territory_queue.popleft()
         self._log(player.play_territory(territory, self.game.stack))
         self.resolve_stack()
-        self._render_player(self.human_index)
+        self._mark_dirty(self.human_index)
 
     def pray(self) -> None:
         if not self._assert_human_turn():
             return
-        player = self.game.players[self.human_index]
-        opponent = self.game.players[self.cpu_index]
+        player = self._human
+        opponent = self._cpu
         messages = player.pray_with_gods(opponent, self.game.stack)
         if not messages:
             self._log("No Gods to pray to.")
-        for msg in messages:
-            self._log(msg)
+        self._log_many(messages)
         self.resolve_stack()
-        self._render_player(self.human_index)
-        self._render_player(self.cpu_index)
+        self._mark_dirty(self.human_index, self.cpu_index)
 
     def resolve_stack(self) -> None:
-        for msg in self.game.stack.resolve_all():
-            self._log(msg)
-        self._render_player(0)
-        self._render_player(1)
+        self._log_many(self.game.stack.resolve_all())
+        self._mark_dirty(0, 1)
 
     def end_turn(self) -> None:
         if not self._assert_human_turn():
             return
-        self._log(f"{self.game.players[self.human_index].name} ends the turn.")
+        self._log(f"{self._human.name} ends the turn.")
         self.active_index = self.cpu_index
-        self._update_active_label()
-        self._render_player(0)
-        self._render_player(1)
+        self._mark_dirty(0, 1)
         self._run_cpu_turn()
 
     def _run_cpu_turn(self) -> None:
-        cpu = self.game.players[self.cpu_index]
-        human = self.game.players[self.human_index]
+        """Play the CPU turn one action per tick so Tk can repaint in between."""
+
+        cpu = self._cpu
+        human = self._human
         self._log(f"{cpu.name}'s turn begins.")
-        for msg in cpu.draw():
-            self._log(msg)
+        self._cpu_steps = deque(
+            (
+                lambda: self._log_many(cpu.draw()),
+                lambda: self._cpu_play_territory(cpu),
+                lambda: self._cpu_play_card(cpu),
+                self.resolve_stack,
+                lambda: self._log_many(cpu.pray_with_gods(human, self.game.stack)),
+                self.resolve_stack,
+                lambda: self._finish_cpu_turn(cpu, human),
+            )
+        )
+        self.root.after(self.CPU_STEP_MS, self._run_cpu_step)
+
+    def _run_cpu_step(self) -> None:
+        if not self._cpu_steps:
+            return
+        self._cpu_steps.popleft()()
+        self._mark_dirty(0, 1)
+        if self._cpu_steps:
+            self.root.after(self.CPU_STEP_MS, self._run_cpu_step)
+
+    def _cpu_play_territory(self, cpu: PlayerState) -> None:
         if cpu.territory_queue:
-            territory = cpu.territory_queue.pop(0)
+            territory = cpu.territory_queue.popleft()
             self._log(cpu.play_territory(territory, self.game.stack))
+
+    def _cpu_play_card(self, cpu: PlayerState) -> None:
         if cpu.hand:
             self._log(cpu.play_first_affordable(self.game.stack))
-        self.resolve_stack()
-        prayers = cpu.pray_with_gods(human, self.game.stack)
-        for msg in prayers:
-            self._log(msg)
-        self.resolve_stack()
+
+    def _finish_cpu_turn(self, cpu: PlayerState, human: PlayerState) -> None:
         self._log(f"{cpu.name} ends the turn.")
         self.active_index = self.human_index
-        self._update_active_label()
-        self._render_player(0)
-        self._render_player(1)
         self._log(f"It is now {human.name}'s turn.")
 
+    def _refresh_player_refs(self) -> None:
+        """Re-resolve ``_human``/``_cpu``; call whenever ``game`` or the seat indices change."""
+
+        self._human: PlayerState = self.game.players[self.human_index]
+        self._cpu: PlayerState = self.game.players[self.cpu_index]
+
     def _assert_human_turn(self) -> bool:
         if self.active_index != self.human_index:
             self._log("It's not your turn.")
@@ -1794,13 +2386,43 @@ class GameGUI:
         return True
 
     def _update_active_label(self) -> None:
-        self.active_label.configure(text=f"Active player: {self.game.players[self.active_index].name}")
+        text = f"Active player: {self.game.players[self.active_index].name}"
+        if text != self._last_active_text:
+            self.active_label.configure(text=text)
+            self._last_active_text = text
 
     def _log(self, message: str) -> None:
-        self.log_widget.configure(state=tk.NORMAL)
-        self.log_widget.insert(tk.END, message + "\n")
-        self.log_widget.see(tk.END)
-        self.log_widget.configure(state=tk.DISABLED)
+        self._log_many((message,))
+
+    def _log_many(self, messages: Iterable[str]) -> None:
+        """Queue ``messages`` for a single widget write on the next idle flush."""
+
+        pending = self._log_pending
+        start = len(pending)
+        pending.extend(messages)
+        if len(pending) == start:
+            return
+        if not self._log_scheduled:
+            self._log_scheduled = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Write every pending message in one insert and trim the widget to ``LOG_MAX_LINES``."""
+
+        self._log_scheduled = False
+        if not self._log_pending:
+            return
+        text = "\n".join(self._log_pending) + "\n"
+        self._log_pending.clear()
+        widget = self.log_widget
+        widget.configure(state=tk.NORMAL)
+        widget.insert(tk.END, text)
+        # The trailing newline leaves an empty last line, so it is not counted
+        overflow = int(widget.index("end-1c").split(".")[0]) - 1 - self.LOG_MAX_LINES
+        if overflow > 0:
+            widget.delete("1.0", f"{overflow + 1}.0")
+        widget.see(tk.END)
+        widget.configure(state=tk.DISABLED)
 
     def run(self) -> None:
         self.root.mainloop()
@@ -6,20 +6,24 @@ room to add timing windows for evolution checks and responses.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum
+from itertools import cycle
 from typing import Iterable, Iterator, List
 
 
-class Phase(Enum):
-    """Basic turn phases used in the prototype."""
+class Phase(IntEnum):
+    """Basic turn phases used in the prototype.
 
-    START = auto()
-    MAIN = auto()
-    COMBAT = auto()
-    END = auto()
+    Values are dense from zero so a phase can index a dispatch table directly.
+    """
 
+    START = 0
+    MAIN = 1
+    COMBAT = 2
+    END = 3
 
-@dataclass
+
+@dataclass(slots=True)
 class PhaseLoop:
     """Iterator-style helper that cycles through phases for each turn."""
 
@@ -30,11 +34,13 @@ class PhaseLoop:
         return cls([Phase.START, Phase.MAIN, Phase.COMBAT, Phase.END])
 
     def __iter__(self) -> Iterator[Phase]:
-        yield from self.order
+        return iter(self.order)
 
     def cycle(self) -> Iterable[Phase]:
-        """Yield phases indefinitely for repeated turns."""
+        """Yield phases indefinitely for repeated turns.
+
+        The order is snapshotted on the first pass, so later edits to
+        ``order`` only affect iterators created afterwards.
+        """
 
-        while True:
-            for phase in self.order:
-                yield phase
+        return cycle(self.order)
@@ -1,25 +1,29 @@
 """Fear/Belief resource model with instability checks."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool:
     """Track the dual-resource system and derived instability."""
 
     fear: int = 0
     belief: int = 0
+    # Bumped on every add/spend so callers can cache affordability checks
+    revision: int = field(default=0, init=False, compare=False, repr=False)
 
     def add(self, fear: int = 0, belief: int = 0) -> None:
         self.fear += fear
         self.belief += belief
+        self.revision += 1
 
     def spend(self, fear: int = 0, belief: int = 0) -> bool:
         if self.fear < fear or self.belief < belief:
             return False
         self.fear -= fear
         self.belief -= belief
+        self.revision += 1
         return True
 
     @property
@@ -1,11 +1,12 @@
 """Lightweight stack model for pending actions and triggers."""
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, Deque, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class StackItem:
     """Single entry on the game stack."""
 
@@ -21,8 +22,11 @@ class StackItem:
 class GameStack:
     """LIFO stack used for spells, abilities, and delayed effects."""
 
+    __slots__ = ("_items",)
+
     def __init__(self) -> None:
-        self._items: List[StackItem] = []
+        # Top of the stack is the right end; a deque keeps both ends O(1)
+        self._items: Deque[StackItem] = deque()
 
     def push(self, item: StackItem) -> None:
         self._items.append(item)
@@ -35,10 +39,10 @@ class GameStack:
     def is_empty(self) -> bool:
         return not self._items
 
-    def resolve_all(self) -> List[str]:
-        """Resolve the entire stack from top to bottom."""
+    def resolve_all(self, log: Optional[List[str]] = None) -> List[str]:
+        """Resolve the entire stack from top to bottom, appending to ``log`` if given."""
 
-        results: List[str] = []
+        results: List[str] = [] if log is None else log
         while self._items:
             item = self.pop()
             if item:
@@ -7,7 +7,7 @@ from typing import Callable
 from .resources import ResourcePool
 
 
-@dataclass
+@dataclass(slots=True)
 class Territory:
     name: str
     generate: Callable[[ResourcePool], str]
@@ -0,0 +1,77 @@
+import asyncio
+import base64
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+HAVE_DEPS = all(importlib.util.find_spec(name) for name in ("openai", "requests"))
+
+if HAVE_DEPS:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+    import generate_card_images as gen
+
+
+class _StubImages:
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self.calls = 0
+
+    async def generate(self, **_kwargs):
+        self.calls += 1
+        data = SimpleNamespace(b64_json=base64.b64encode(self.payload).decode(), url=None)
+        return SimpleNamespace(data=[data])
+
+
+def _run(card, output_dir, images, prompt_hashes, cache_dir, overwrite):
+    client = SimpleNamespace(images=images)
+    return asyncio.run(
+        gen.generate_image(
+            card,
+            output_dir,
+            client,
+            asyncio.Semaphore(1),
+            prompt_hashes,
+            gen.existing_images(output_dir),
+            overwrite=overwrite,
+            cache_dir=cache_dir,
+        )
+    )
+
+
+@unittest.skipUnless(HAVE_DEPS, "generate_card_images needs openai and requests")
+class ImageCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_path = Path(tmp.name)
+
+    def test_overwrite_bypasses_image_cache(self) -> None:
+        card = gen.unique_cards()[0]
+        cache_dir = self.tmp_path / "cache"
+        first_dir = self.tmp_path / "first"
+        second_dir = self.tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+
+        _run(card, first_dir, _StubImages(b"old"), {}, cache_dir, overwrite=False)
+
+        # Without --overwrite a cache hit is copied into place and the API is not called
+        cached = _StubImages(b"unused")
+        path = _run(card, second_dir, cached, {}, cache_dir, overwrite=False)
+        self.assertEqual(cached.calls, 0)
+        self.assertEqual(path.read_bytes(), b"old")
+
+        fresh = _StubImages(b"new")
+        path = _run(card, second_dir, fresh, {}, cache_dir, overwrite=True)
+        self.assertEqual(fresh.calls, 1)
+        self.assertEqual(path.read_bytes(), b"new")
+        # The regenerated art replaces the cached copy
+        key = gen.cache_key(gen.build_prompt(card), "dall-e-3", "1024x1024")
+        self.assertEqual((cache_dir / f"{key}.png").read_bytes(), b"new")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from tcg.gui import DragState, GameGUI
+
+
+class _StubCanvas:
+    def __init__(self) -> None:
+        self.options: dict = {}
+
+    def itemconfigure(self, item, **options) -> None:
+        self.options.setdefault(item, {}).update(options)
+
+
+def _gui() -> GameGUI:
+    # Only the drop-zone state is exercised, so skip __init__ and its Tk root
+    gui = GameGUI.__new__(GameGUI)
+    gui.battlefield_canvases = [_StubCanvas()]
+    gui.drop_zone_items = {0: (1, 2)}
+    gui._drop_zone_state = {}
+    gui._drop_pulse_generation = {}
+    gui._drop_pulse_rest = {}
+    gui.drag_state = DragState()
+    gui._apply_drop_zone_glow = lambda idx, color: None
+    gui._clear_drop_zone_glow = lambda idx: None
+    gui._set_drop_zone_tint = lambda idx, color: None
+    return gui
+
+
+class DropPulseTest(unittest.TestCase):
+    def test_pulse_returns_zone_to_idle(self) -> None:
+        gui = _gui()
+        gui._style_drop_zone(0, True)
+        self.assertTrue(gui._drop_zone_state[0][1])
+
+        gui._drop_pulse_generation[0] = 1
+        gui._pulse_drop_zone(0, 1, GameGUI.SURFACE_COLOR, True)
+
+        self.assertFalse(gui._drop_zone_state[0][1])
+        rect_options = gui.battlefield_canvases[0].options[1]
+        self.assertEqual(rect_options["outline"], GameGUI._DROP_STYLE_IDLE["outline"])
+
+    def test_pulse_keeps_highlight_of_new_drag(self) -> None:
+        gui = _gui()
+        gui._style_drop_zone(0, True)
+        gui.drag_state.hovered_target = 0
+
+        gui._drop_pulse_generation[0] = 1
+        gui._pulse_drop_zone(0, 1, GameGUI.SURFACE_COLOR, True)
+
+        self.assertTrue(gui._drop_zone_state[0][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
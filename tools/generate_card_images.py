@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
 import base64
+import hashlib
+import json
+import os
+import random
+import shutil
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 import re
-from typing import Iterable, Set
+from typing import AbstractSet, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from openai import APIStatusError, OpenAI, PermissionDeniedError
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI, PermissionDeniedError
 
 # Ensure the project root is on the import path when executed as a script
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -27,6 +37,24 @@ from tcg.cards import (
     territory_card_pool,
 )
 
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RPM = 50
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# Rate limits and server-side failures are worth retrying; other statuses are not
+RETRYABLE_STATUS = {408, 409, 429}
+# Sidecar in the output directory mapping card slug -> sha256 of the prompt that produced it
+PROMPT_HASHES_NAME = "prompts.json"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Must stay a multiple of 4 so every slice is a whole number of base64 groups
+B64_CHUNK_CHARS = 4 * 16 * 1024
+# Content-addressed store of every image generated, shared across output directories
+DEFAULT_CACHE_DIR = Path(".cache/card-images")
+BATCH_ENDPOINT = "/v1/images/generations"
+BATCH_POLL_INITIAL = 10.0
+BATCH_POLL_MAX = 300.0
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
 
 SCENE_CUES = {
     "forest": "mist-laced ancient forest with towering trees and mossy stones",
@@ -56,17 +84,24 @@ SCENE_CUES = {
 }
 
 
-def iter_unique_cards() -> Iterable[Card]:
-    """Yield each unique card across all pools once."""
+def unique_cards() -> List[Card]:
+    """Return each unique card across all pools once.
 
-    pools = [cryptid_pool(), event_pool(), territory_card_pool(), god_pool()]
-    seen: Set[str] = set()
-    for pool in pools:
+    When a name appears in several pools, the earliest pool's card wins.
+    """
+
+    cards: Dict[str, Card] = {}
+    for pool in (cryptid_pool(), event_pool(), territory_card_pool(), god_pool()):
         for card in pool.values():
-            if card.name in seen:
-                continue
-            seen.add(card.name)
-            yield card
+            cards.setdefault(card.name, card)
+    return list(cards.values())
+
+
+# One scan per term finds every keyword it contains. The lookahead keeps overlapping
+# keywords from hiding each other (no keyword is a prefix of another), and the
+# earliest SCENE_CUES entry still wins as with the old nested loop.
+_SCENE_KEYWORD_RANK = {keyword: rank for rank, keyword in enumerate(SCENE_CUES)}
+_SCENE_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, SCENE_CUES)) + "))")
 
 
 def _scene_from_card(card: Card) -> str:
@@ -74,20 +109,23 @@ def _scene_from_card(card: Card) -> str:
     search_terms = list(territory_types) + list(card.tags)
 
     for term in search_terms:
-        normalized = term.lower()
-        for keyword, description in SCENE_CUES.items():
-            if keyword in normalized:
-                return description
+        found = _SCENE_KEYWORD_RE.findall(term.lower())
+        if found:
+            return SCENE_CUES[min(found, key=_SCENE_KEYWORD_RANK.__getitem__)]
 
     return "moody natural biome that fits the legend"
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 def _text_snippet(text: str, *, limit: int = 140) -> str:
-    cleaned = re.sub(r"\s+", " ", text or "").strip()
+    cleaned = _WHITESPACE_RE.sub(" ", text or "").strip()
     if not cleaned:
         return ""
 
-    sentences = [part.strip() for part in re.split(r"(?<=[.!?])\s+", cleaned) if part.strip()]
+    sentences = [part.strip() for part in _SENTENCE_BREAK_RE.split(cleaned) if part.strip()]
     snippet = sentences[0] if sentences else cleaned
     if len(snippet) > limit:
         snippet = snippet[:limit].rstrip()
@@ -184,61 +222,375 @@ def build_prompt(card: Card) -> str:
     )
 
 
-def generate_image(
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def _atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """Write to a sibling temp file and rename it over ``path`` only once complete.
+
+    An interrupted write never leaves a truncated PNG behind for the existence
+    check to mistake for a finished image.
+    """
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as handle:
+            yield handle
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _copy_file(source: Path, destination: Path) -> None:
+    with open(source, "rb") as src, _atomic_write(destination) as dst:
+        shutil.copyfileobj(src, dst)
+
+
+def cache_key(prompt: str, model: str, size: str) -> str:
+    return hashlib.sha256(f"{model}|{size}|{prompt}".encode("utf-8")).hexdigest()
+
+
+def _restore_cached(cache_dir: Optional[Path], key: str, card: Card, output_path: Path) -> bool:
+    """Copy a previously generated image for ``key`` into place, if the cache has one."""
+
+    if cache_dir is None:
+        return False
+    cached = cache_dir / f"{key}.png"
+    if not cached.exists():
+        return False
+    _copy_file(cached, output_path)
+    print(f"Restored {card.name} -> {output_path} from {cached}")
+    return True
+
+
+def _store_cached(cache_dir: Optional[Path], key: str, output_path: Path) -> None:
+    if cache_dir is None:
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _copy_file(output_path, cache_dir / f"{key}.png")
+
+
+def existing_images(output_dir: Path) -> Set[str]:
+    """Slugs with a PNG in ``output_dir``, from one directory scan instead of a stat per card."""
+
+    with os.scandir(output_dir) as entries:
+        return {entry.name[:-4] for entry in entries if entry.name.endswith(".png") and entry.is_file()}
+
+
+def load_prompt_hashes(output_dir: Path) -> Dict[str, str]:
+    path = output_dir / PROMPT_HASHES_NAME
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        print(f"Ignoring unreadable {path}: {exc}")
+        return {}
+
+
+def save_prompt_hashes(output_dir: Path, hashes: Dict[str, str]) -> None:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / PROMPT_HASHES_NAME
+    path.write_text(json.dumps(hashes, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def _http_session(pool_size: int) -> requests.Session:
+    """Shared session so URL-mode downloads reuse kept-alive connections.
+
+    ``pool_size`` should match the request concurrency; a smaller pool makes
+    concurrent downloads wait for, or discard, pooled connections.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _download_image(url: str, output_path: Path, pool_size: int) -> None:
+    """Stream a URL-mode image to disk without holding the whole body in memory."""
+
+    with _http_session(pool_size).get(url, stream=True, timeout=30) as download:
+        download.raise_for_status()
+        with _atomic_write(output_path) as handle:
+            for chunk in download.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                handle.write(chunk)
+
+
+def _write_b64_image(output_path: Path, image_b64: str) -> None:
+    """Decode ``image_b64`` slice by slice so the full PNG is never held in memory."""
+
+    with _atomic_write(output_path) as handle:
+        for start in range(0, len(image_b64), B64_CHUNK_CHARS):
+            handle.write(base64.b64decode(image_b64[start : start + B64_CHUNK_CHARS], validate=False))
+
+
+async def _save_image(
+    output_path: Path,
+    image_b64: Optional[str],
+    image_url: Optional[str],
+    pool_size: int = DEFAULT_CONCURRENCY,
+) -> bool:
+    """Write base64 or URL-mode image data to ``output_path``; False if there was neither."""
+
+    if image_b64:
+        # Decoding and writing a multi-megabyte PNG would otherwise stall every other worker
+        await asyncio.to_thread(_write_b64_image, output_path, image_b64)
+    elif image_url:  # pragma: no cover - depends on API response
+        # requests is blocking, so keep it off the event loop
+        await asyncio.to_thread(_download_image, image_url, output_path, pool_size)
+    else:
+        return False
+    return True
+
+
+def _is_current(
+    card: Card,
+    output_path: Path,
+    slug: str,
+    digest: str,
+    prompt_hashes: Dict[str, str],
+    existing: AbstractSet[str],
+    overwrite: bool,
+) -> bool:
+    """Whether the image on disk was made from the current prompt and can be kept.
+
+    Images with no recorded hash predate the sidecar and are adopted as-is.
+    """
+
+    if overwrite or slug not in existing:
+        return False
+    recorded = prompt_hashes.setdefault(slug, digest)
+    if recorded == digest:
+        print(f"Skipping {card.name}: {output_path} already exists")
+        return True
+    print(f"Regenerating {card.name}: prompt changed since {output_path} was made")
+    return False
+
+
+def _is_retryable(exc: APIStatusError) -> bool:
+    return exc.status_code in RETRYABLE_STATUS or exc.status_code >= 500
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter so concurrent workers don't retry in lockstep."""
+
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class RequestPacer:
+    """Space out request starts so at most ``per_minute`` begin in any minute.
+
+    The semaphore bounds how many requests are in flight; this bounds how fast
+    new ones start, which is what the API's RPM limit counts. A non-positive
+    rate disables pacing.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self._interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        now = asyncio.get_running_loop().time()
+        # Claim the slot before sleeping so concurrent callers queue behind it
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+async def _request_image(
+    client: AsyncOpenAI,
+    prompt: str,
+    *,
+    size: str,
+    model: str,
+    pacer: Optional[RequestPacer] = None,
+):
+    """Call the image endpoint, retrying rate limits, server errors and dropped connections."""
+
+    for attempt in range(MAX_ATTEMPTS):
+        if pacer is not None:
+            await pacer.wait()
+        try:
+            return await client.images.generate(
+                model=model,
+                prompt=prompt,
+                size=size,
+            )
+        except PermissionDeniedError as exc:  # pragma: no cover - API behavior
+            message = (
+                "Image generation failed with a permission error. The selected model "
+                f"'{model}' may require organization verification or access. Try choosing "
+                "a model available to your account (e.g., 'dall-e-3') or verify your "
+                "organization at https://platform.openai.com/settings/organization/general."
+            )
+            raise SystemExit(message) from exc
+        except APIStatusError as exc:  # pragma: no cover - API behavior
+            if attempt + 1 == MAX_ATTEMPTS or not _is_retryable(exc):
+                raise SystemExit(f"Image generation failed: for {prompt} {exc.message}") from exc
+            reason = f"status {exc.status_code}"
+        except APIConnectionError as exc:  # pragma: no cover - network behavior
+            if attempt + 1 == MAX_ATTEMPTS:
+                raise SystemExit(f"Image generation failed: for {prompt} {exc}") from exc
+            reason = "connection error"
+        delay = _retry_delay(attempt)
+        print(f"Image request failed ({reason}); attempt {attempt + 2}/{MAX_ATTEMPTS} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+
+async def generate_image(
     card: Card,
     output_dir: Path,
-    client: OpenAI,
+    client: AsyncOpenAI,
+    semaphore: asyncio.Semaphore,
+    prompt_hashes: Dict[str, str],
+    existing: AbstractSet[str],
     *,
     overwrite: bool = False,
     size: str = "1024x1024",
     model: str = "dall-e-3",
+    cache_dir: Optional[Path] = None,
+    pacer: Optional[RequestPacer] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> Path:
-    """Call ChatGPT image generation for a card and persist it to disk."""
+    """Call ChatGPT image generation for a card and persist it to disk.
+
+    ``semaphore`` bounds how many requests are in flight across all cards and
+    ``pacer``, when given, holds every attempt (retries included) to the RPM limit.
+    ``concurrency`` is the limit ``semaphore`` was built with; it also sizes the
+    connection pool used for URL-mode downloads.
+    ``prompt_hashes`` records which prompt produced each existing image; a card
+    whose prompt has changed since is regenerated. ``cache_dir`` holds every
+    image generated so far keyed by prompt, model and size; a hit there is
+    copied into place instead of calling the API, unless ``overwrite`` is set;
+    the fresh image then replaces the cached one. ``existing`` holds the slugs
+    already in ``output_dir`` (see ``existing_images``), which must exist.
+    """
 
-    output_dir.mkdir(parents=True, exist_ok=True)
     slug = slugify(card.name)
     output_path = output_dir / f"{slug}.png"
-    if output_path.exists() and not overwrite:
-        print(f"Skipping {card.name}: {output_path} already exists")
+    prompt = build_prompt(card)
+    digest = prompt_hash(prompt)
+    if _is_current(card, output_path, slug, digest, prompt_hashes, existing, overwrite):
+        return output_path
+    key = cache_key(prompt, model, size)
+    # --overwrite asks for fresh art, so it must not be satisfied from the cache either
+    if not overwrite and await asyncio.to_thread(_restore_cached, cache_dir, key, card, output_path):
+        prompt_hashes[slug] = digest
         return output_path
 
-    prompt = build_prompt(card)
-    try:
-        response = client.images.generate(
-            model=model,
-            prompt=prompt,
-            size=size,
-        )
-    except PermissionDeniedError as exc:  # pragma: no cover - API behavior
-        message = (
-            "Image generation failed with a permission error. The selected model "
-            f"'{model}' may require organization verification or access. Try choosing "
-            "a model available to your account (e.g., 'dall-e-3') or verify your "
-            "organization at https://platform.openai.com/settings/organization/general."
-        )
-        raise SystemExit(message) from exc
-    except APIStatusError as exc:  # pragma: no cover - API behavior
-        raise SystemExit(f"Image generation failed: for {prompt} {exc.message}") from exc
+    async with semaphore:
+        response = await _request_image(client, prompt, size=size, model=model, pacer=pacer)
 
     image = response.data[0]
+    del response
     image_b64 = getattr(image, "b64_json", None)
-    if image_b64:
-        output_path.write_bytes(base64.b64decode(image_b64))
-    elif getattr(image, "url", None):  # pragma: no cover - depends on API response
-        download = requests.get(image.url, timeout=30)
-        download.raise_for_status()
-        output_path.write_bytes(download.content)
-    else:  # pragma: no cover - depends on API response
+    image_url = getattr(image, "url", None)
+    del image
+    if not await _save_image(output_path, image_b64, image_url, concurrency):  # pragma: no cover - depends on API response
         raise SystemExit(
             "Image generation did not return image data. "
             "Try rerunning with a supported model (e.g., 'dall-e-3')."
         )
 
+    await asyncio.to_thread(_store_cached, cache_dir, key, output_path)
+    prompt_hashes[slug] = digest
     print(f"Saved {card.name} -> {output_path}")
     return output_path
 
 
-def main() -> None:
+async def generate_batch(
+    cards: Iterable[Card],
+    output_dir: Path,
+    client: AsyncOpenAI,
+    prompt_hashes: Dict[str, str],
+    *,
+    overwrite: bool = False,
+    size: str = "1024x1024",
+    model: str = "dall-e-3",
+    cache_dir: Optional[Path] = None,
+) -> None:
+    """Submit every outdated card as one Batch API job and save the results.
+
+    Batch jobs are billed at a discount and do not count against the per-minute
+    limits, but may take up to the 24h completion window to finish. Cards that
+    fail inside the batch are reported and left for the next run.
+    """
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    existing = existing_images(output_dir)
+    pending: Dict[str, Tuple[Card, str, str]] = {}
+    lines = []
+    for card in cards:
+        slug = slugify(card.name)
+        output_path = output_dir / f"{slug}.png"
+        prompt = build_prompt(card)
+        digest = prompt_hash(prompt)
+        if _is_current(card, output_path, slug, digest, prompt_hashes, existing, overwrite):
+            continue
+        key = cache_key(prompt, model, size)
+        if not overwrite and _restore_cached(cache_dir, key, card, output_path):
+            prompt_hashes[slug] = digest
+            continue
+        pending[slug] = (card, digest, key)
+        body = {"model": model, "prompt": prompt, "size": size}
+        lines.append(json.dumps({"custom_id": slug, "method": "POST", "url": BATCH_ENDPOINT, "body": body}))
+    if not lines:
+        print("Every card image is up to date")
+        return
+
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    upload = await client.files.create(file=("card-images.jsonl", payload), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=upload.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h",
+    )
+    print(f"Submitted batch {batch.id} with {len(lines)} cards")
+
+    delay = BATCH_POLL_INITIAL
+    while batch.status not in BATCH_FINAL_STATUSES:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX)
+        batch = await client.batches.retrieve(batch.id)
+        print(f"Batch {batch.id}: {batch.status}")
+    if batch.status != "completed" or not batch.output_file_id:
+        raise SystemExit(f"Batch {batch.id} ended with status '{batch.status}'")
+
+    content = await client.files.content(batch.output_file_id)
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        entry = pending.pop(record.get("custom_id"), None)
+        if entry is None:
+            continue
+        card, digest, key = entry
+        response = record.get("response") or {}
+        data = (response.get("body") or {}).get("data") or [{}]
+        output_path = output_dir / f"{record['custom_id']}.png"
+        if response.get("status_code") != 200 or not await _save_image(
+            output_path, data[0].get("b64_json"), data[0].get("url")
+        ):
+            print(f"Failed {card.name}: {record.get('error') or response.get('body')}")
+            continue
+        await asyncio.to_thread(_store_cached, cache_dir, key, output_path)
+        prompt_hashes[record["custom_id"]] = digest
+        print(f"Saved {card.name} -> {output_path}")
+    for card, _, _ in pending.values():
+        print(f"Failed {card.name}: no result in batch {batch.id}")
+
+
+async def main() -> None:
     parser = argparse.ArgumentParser(description="Generate image assets for all cards.")
     parser.add_argument(
         "--output-dir",
@@ -249,7 +601,7 @@ def main() -> None:
     parser.add_argument(
         "--overwrite",
         action="store_true",
-        help="Recreate images even if a file already exists",
+        help="Recreate images through the API even if a file or cached copy already exists",
     )
     parser.add_argument(
         "--size",
@@ -265,19 +617,83 @@ def main() -> None:
             "Use a model available to your account."
         ),
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of image requests in flight (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit all outdated cards as one discounted Batch API job and wait for it",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Content-addressed image cache reused across runs (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read from nor write to the image cache",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=DEFAULT_RPM,
+        help=f"Maximum image requests started per minute; 0 disables pacing (default: {DEFAULT_RPM})",
+    )
     args = parser.parse_args()
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    prompt_hashes = load_prompt_hashes(args.output_dir)
+    # Registered before any request so images saved before a failure are still recorded
+    atexit.register(save_prompt_hashes, args.output_dir, prompt_hashes)
+
+    cards = unique_cards()
+    print(f"Checking {len(cards)} unique cards in {args.output_dir}")
 
-    client = OpenAI()
-    for card in iter_unique_cards():
-        generate_image(
-            card,
+    client = AsyncOpenAI()
+    if args.batch:
+        await generate_batch(
+            cards,
             args.output_dir,
             client,
+            prompt_hashes,
             overwrite=args.overwrite,
             size=args.size,
             model=args.model,
+            cache_dir=cache_dir,
         )
+        return
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    existing = existing_images(args.output_dir)
+    concurrency = max(1, args.concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    pacer = RequestPacer(args.rpm)
+    await asyncio.gather(
+        *(
+            generate_image(
+                card,
+                args.output_dir,
+                client,
+                semaphore,
+                prompt_hashes,
+                existing,
+                overwrite=args.overwrite,
+                size=args.size,
+                model=args.model,
+                cache_dir=cache_dir,
+                pacer=pacer,
+                concurrency=concurrency,
+            )
+            for card in cards
+        )
+    )
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())